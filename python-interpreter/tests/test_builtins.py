@@ -125,6 +125,12 @@ class TestBuiltinTypeOperations(unittest.TestCase):
     def setUp(self):
         self.builtins = Builtins(None)
 
+    def test_table_is_read_only(self):
+        table = self.builtins.table
+        self.assertIs(table['TYPEOF'].__func__, Builtins.typeof)
+        with self.assertRaises(TypeError):
+            table['TYPEOF'] = None
+
     def test_typeof(self):
         self.assertEqual(self.builtins.typeof(42), "INTEGER")
         self.assertEqual(self.builtins.typeof(3.14), "FLOAT")
@@ -443,6 +449,32 @@ class TestBuiltinFileOperations(unittest.TestCase):
         result = self.builtins.scry(test_file)
         self.assertEqual(result, "")
 
+    def test_scry_normalizes_newlines(self):
+        """Test SCRY reads CRLF and CR line endings as LF."""
+        test_file = os.path.join(self.temp_dir, "crlf.txt")
+        with open(test_file, 'wb') as f:
+            f.write(b"line 1\r\nline 2\rline 3")
+
+        result = self.builtins.scry(test_file)
+        self.assertEqual(result, "line 1\nline 2\nline 3")
+
+    def test_scry_large_file(self):
+        """Test reading a file larger than the single-read threshold."""
+        test_file = os.path.join(self.temp_dir, "large.txt")
+        test_content = "0123456789\n" * 10000
+        with open(test_file, 'w', encoding='utf-8') as f:
+            f.write(test_content)
+
+        result = self.builtins.scry(test_file)
+        self.assertEqual(result, test_content)
+
+    def test_scry_directory(self):
+        """Test SCRY on a directory reports a read error."""
+        with self.assertRaises(RuntimeError) as context:
+            self.builtins.scry(self.temp_dir)
+        self.assertIn("Cannot read file", str(context.exception))
+        self.assertIn(self.temp_dir, str(context.exception))
+
     def test_scry_file_not_found(self):
         """Test SCRY with non-existent file."""
         nonexistent_file = os.path.join(self.temp_dir, "nonexistent.txt")
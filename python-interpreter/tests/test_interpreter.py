@@ -4,23 +4,33 @@ import unittest
 import asyncio
 import sys
 import os
+import tempfile
+import threading
 from io import StringIO
 from contextlib import redirect_stdout
+from functools import lru_cache
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from untildeath.lexer import Lexer
 from untildeath.parser import Parser
 from untildeath.interpreter import Interpreter
+from untildeath import entities
 from untildeath.errors import RuntimeError, CondemnError
 
 
-def run_program(source: str) -> str:
-    """Run a !~ATH program and return stdout."""
+@lru_cache(maxsize=256)
+def compile_program(source: str):
+    """Lex and parse a !~ATH program, caching the AST by source text."""
     lexer = Lexer(source)
     tokens = lexer.tokenize()
     parser = Parser(tokens)
-    program = parser.parse()
+    return parser.parse()
+
+
+def run_program(source: str) -> str:
+    """Run a !~ATH program and return stdout."""
+    program = compile_program(source)
     interpreter = Interpreter()
 
     output = StringIO()
@@ -32,10 +42,7 @@ def run_program(source: str) -> str:
 
 def run_program_async(source: str):
     """Run a !~ATH program asynchronously."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    program = parser.parse()
+    program = compile_program(source)
     interpreter = Interpreter()
     return asyncio.run(interpreter.run(program))
 
@@ -52,6 +59,28 @@ class TestInterpreterBasics(unittest.TestCase):
         output = run_program(source)
         self.assertEqual(output.strip(), "Hello, world!")
 
+    def test_globals_persist_across_runs(self):
+        """Running a second program on the same interpreter sees earlier bindings."""
+        interpreter = Interpreter()
+        output = StringIO()
+        with redirect_stdout(output):
+            asyncio.run(interpreter.run(compile_program('BIRTH x WITH 41; THIS.DIE();')))
+            asyncio.run(interpreter.run(compile_program('UTTER(x + 1); THIS.DIE();')))
+        self.assertEqual(output.getvalue().strip(), "42")
+
+    def test_finished_tasks_are_released(self):
+        """Background tasks leave _pending_tasks as soon as they finish."""
+        async def main():
+            interpreter = Interpreter()
+            task = asyncio.ensure_future(asyncio.sleep(0))
+            interpreter._track_task(task)
+            self.assertIn(task, interpreter._pending_tasks)
+            await task
+            await asyncio.sleep(0)  # let the done callback run
+            return interpreter._pending_tasks
+
+        self.assertEqual(asyncio.run(main()), set())
+
     def test_empty_program(self):
         source = '''
         import timer T(1ms);
@@ -918,6 +947,39 @@ class TestInterpreterTimers(unittest.TestCase):
         self.assertEqual(lines, ["3", "2", "1"])
 
 
+class TestInterpreterWatchers(unittest.TestCase):
+    """Test watcher entities sharing a directory poll."""
+
+    def run_with_deletion(self, count: int) -> str:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, f"f{i}.txt") for i in range(count)]
+            for path in paths:
+                open(path, 'w').close()
+            imports = "\n".join(
+                f'import watcher W{i}("{path.replace(os.sep, "/")}");'
+                for i, path in enumerate(paths))
+            source = f'''
+            {imports}
+            ~ATH(W0) {{ }} EXECUTE(UTTER("W0 gone"));
+            THIS.DIE();
+            '''
+            deleter = threading.Timer(0.05, os.remove, [paths[0]])
+            deleter.start()
+            try:
+                return run_program(source)
+            finally:
+                deleter.join()
+
+    def test_deletion_with_sibling_watchers(self):
+        self.assertEqual(self.run_with_deletion(2).strip(), "W0 gone")
+        self.assertEqual(entities._watch_registry, {})
+
+    def test_deletion_in_scanned_directory(self):
+        count = entities.SCANDIR_THRESHOLD + 4
+        self.assertEqual(self.run_with_deletion(count).strip(), "W0 gone")
+        self.assertEqual(entities._watch_registry, {})
+
+
 class TestInterpreterEntityCombinations(unittest.TestCase):
     """Test entity combination operators."""
 
@@ -941,6 +1003,30 @@ class TestInterpreterEntityCombinations(unittest.TestCase):
         output = run_program(source)
         self.assertEqual(output.strip(), "both done")
 
+    def test_entity_or_with_dead_child(self):
+        source = '''
+        import timer T1(1s);
+        import timer T2(1s);
+        T1.DIE();
+        ~ATH(T1 || T2) { } EXECUTE(UTTER("done"));
+        T2.DIE();
+        THIS.DIE();
+        '''
+        output = run_program(source)
+        self.assertEqual(output.strip(), "done")
+
+    def test_entity_and_with_dead_children(self):
+        source = '''
+        import timer T1(1s);
+        import timer T2(1s);
+        T1.DIE();
+        T2.DIE();
+        ~ATH(T1 && T2) { } EXECUTE(UTTER("both done"));
+        THIS.DIE();
+        '''
+        output = run_program(source)
+        self.assertEqual(output.strip(), "both done")
+
     def test_entity_not(self):
         source = '''
         import timer T(1s);
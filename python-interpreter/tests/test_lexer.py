@@ -73,6 +73,17 @@ class TestLexerIntegers(unittest.TestCase):
         self.assertEqual(tokens[0].type, TokenType.INTEGER)
         self.assertEqual(tokens[0].value, 1234567890)
 
+    def test_non_decimal_digit(self):
+        """Digits that are not decimal, such as '²', are not integer literals."""
+        with self.assertRaises(LexerError):
+            Lexer("²").tokenize()
+
+    def test_unicode_decimal_digits(self):
+        """Unicode decimal digits lex as numbers, as int() reads them."""
+        self.assertEqual(Lexer("٣٤").tokenize()[0].value, 34)
+        self.assertEqual(Lexer("-٣").tokenize()[0].value, -3)
+        self.assertEqual(Lexer("٣s").tokenize()[0].value, ('s', 3))
+
 
 class TestLexerFloats(unittest.TestCase):
     """Test float literal tokenization."""
@@ -302,6 +313,12 @@ class TestLexerIdentifiers(unittest.TestCase):
         self.assertEqual(tokens[0].type, TokenType.IDENTIFIER)
         self.assertEqual(tokens[0].value, "timer2")
 
+    def test_non_ascii_identifier(self):
+        lexer = Lexer("caf\u00e9 \u00e9t\u00e9 x")
+        tokens = lexer.tokenize()
+        self.assertEqual([t.value for t in tokens[:3]], ["caf\u00e9", "\u00e9t\u00e9", "x"])
+        self.assertEqual(tokens[2].column, 10)
+
     def test_case_sensitivity(self):
         """Identifiers are case-sensitive."""
         lexer = Lexer("this THIS This")
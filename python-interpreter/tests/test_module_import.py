@@ -2,11 +2,14 @@
 
 import unittest
 import asyncio
+import atexit
 import sys
 import os
 import tempfile
+import time
 from io import StringIO
 from contextlib import redirect_stdout, redirect_stderr
+from functools import lru_cache
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -16,16 +19,27 @@ from untildeath.interpreter import Interpreter
 from untildeath.errors import RuntimeError as AthRuntimeError, TildeAthError
 
 
-def run_program(source: str, source_file: str = None) -> str:
-    """Run a !~ATH program and return stdout."""
+# Shared sink for interpreter warnings the tests do not inspect
+DEVNULL = open(os.devnull, 'w')
+atexit.register(DEVNULL.close)
+
+
+@lru_cache(maxsize=128)
+def compile_program(source: str):
+    """Lex and parse a !~ATH program, caching the AST by source text."""
     lexer = Lexer(source)
     tokens = lexer.tokenize()
     parser = Parser(tokens)
-    program = parser.parse()
+    return parser.parse()
+
+
+def run_program(source: str, source_file: str = None) -> str:
+    """Run a !~ATH program and return stdout."""
+    program = compile_program(source)
     interpreter = Interpreter(source_file=source_file)
 
     output = StringIO()
-    with redirect_stdout(output), redirect_stderr(StringIO()):
+    with redirect_stdout(output), redirect_stderr(DEVNULL):
         asyncio.run(interpreter.run(program))
 
     return output.getvalue()
@@ -36,249 +50,279 @@ def ath_path(path):
     return path.replace('\\', '/')
 
 
+# Import a module and print one of its exports
+EXPORT_PROGRAM = '''
+    import watcher W("{path}");
+    UTTER(W.{export});
+    THIS.DIE();
+'''
+
+
 def write_module(tmpdir, filename, content):
     """Write a module file and return its path."""
     path = os.path.join(tmpdir, filename)
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content.encode('utf-8'))
+    finally:
+        os.close(fd)
     return path
 
 
+def write_modules(tmpdir, modules):
+    """Write several module files from a {filename: content} dict."""
+    for filename, content in modules.items():
+        write_module(tmpdir, filename, content)
+
+
 class TestModuleImport(unittest.TestCase):
     """Test module import functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        # One directory per test so module filenames never collide. The
+        # class directory is already unique to this process, and method
+        # names are unique within the class.
+        self.tmpdir = os.path.join(self._tmp.name, self._testMethodName)
+        os.mkdir(self.tmpdir)
+        self.ath_tmpdir = ath_path(self.tmpdir)
+
+    def module_path(self, filename):
+        """Path of a module in this test's directory, as a !~ATH string."""
+        return f"{self.ath_tmpdir}/{filename}"
+
     def test_basic_rite_import(self):
         """Module defines a rite, caller invokes it via W.rite()."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            write_module(tmpdir, "mathlib.~ATH", '''
-                RITE add(a, b) {
-                    BEQUEATH a + b;
-                }
-                THIS.DIE();
-            ''')
-
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            source = f'''
-                import watcher W("{ath_path(os.path.join(tmpdir, "mathlib.~ATH"))}");
-                BIRTH result WITH W.add(3, 4);
-                UTTER(result);
-                THIS.DIE();
-            '''
-            output = run_program(source, source_file=main_path)
-            self.assertEqual(output.strip(), "7")
+        write_module(self.tmpdir, "mathlib.~ATH", '''
+            RITE add(a, b) {
+                BEQUEATH a + b;
+            }
+            THIS.DIE();
+        ''')
+
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = f'''
+            import watcher W("{self.module_path("mathlib.~ATH")}");
+            BIRTH result WITH W.add(3, 4);
+            UTTER(result);
+            THIS.DIE();
+        '''
+        output = run_program(source, source_file=main_path)
+        self.assertEqual(output.strip(), "7")
 
     def test_variable_export(self):
         """Access a top-level BIRTH variable from module."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            write_module(tmpdir, "config.~ATH", '''
-                BIRTH greeting WITH "Hello from module";
-                THIS.DIE();
-            ''')
+        write_module(self.tmpdir, "config.~ATH", '''
+            BIRTH greeting WITH "Hello from module";
+            THIS.DIE();
+        ''')
 
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            source = f'''
-                import watcher W("{ath_path(os.path.join(tmpdir, "config.~ATH"))}");
-                UTTER(W.greeting);
-                THIS.DIE();
-            '''
-            output = run_program(source, source_file=main_path)
-            self.assertEqual(output.strip(), "Hello from module")
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = EXPORT_PROGRAM.format(path=self.module_path("config.~ATH"), export="greeting")
+        output = run_program(source, source_file=main_path)
+        self.assertEqual(output.strip(), "Hello from module")
 
     def test_constant_export(self):
         """Access an ENTOMB constant from module."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            write_module(tmpdir, "constants.~ATH", '''
-                ENTOMB PI WITH 3;
-                THIS.DIE();
-            ''')
+        write_module(self.tmpdir, "constants.~ATH", '''
+            ENTOMB PI WITH 3;
+            THIS.DIE();
+        ''')
 
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            source = f'''
-                import watcher W("{ath_path(os.path.join(tmpdir, "constants.~ATH"))}");
-                UTTER(W.PI);
-                THIS.DIE();
-            '''
-            output = run_program(source, source_file=main_path)
-            self.assertEqual(output.strip(), "3")
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = EXPORT_PROGRAM.format(path=self.module_path("constants.~ATH"), export="PI")
+        output = run_program(source, source_file=main_path)
+        self.assertEqual(output.strip(), "3")
 
     def test_nonexistent_export_error(self):
         """W.nope raises RuntimeError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            write_module(tmpdir, "lib.~ATH", '''
-                BIRTH x WITH 1;
-                THIS.DIE();
-            ''')
+        write_module(self.tmpdir, "lib.~ATH", '''
+            BIRTH x WITH 1;
+            THIS.DIE();
+        ''')
 
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            source = f'''
-                import watcher W("{ath_path(os.path.join(tmpdir, "lib.~ATH"))}");
-                UTTER(W.nope);
-                THIS.DIE();
-            '''
-            with self.assertRaises(TildeAthError) as ctx:
-                run_program(source, source_file=main_path)
-            self.assertIn("no export", str(ctx.exception))
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = EXPORT_PROGRAM.format(path=self.module_path("lib.~ATH"), export="nope")
+        with self.assertRaises(TildeAthError) as ctx:
+            run_program(source, source_file=main_path)
+        self.assertIn("no export", str(ctx.exception))
 
     def test_rite_with_closure(self):
         """Module rite references a module-local variable."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            write_module(tmpdir, "greeter.~ATH", '''
-                BIRTH prefix WITH "Hello, ";
-                RITE greet(name) {
-                    BEQUEATH prefix + name;
-                }
-                THIS.DIE();
-            ''')
-
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            source = f'''
-                import watcher W("{ath_path(os.path.join(tmpdir, "greeter.~ATH"))}");
-                BIRTH msg WITH W.greet("World");
-                UTTER(msg);
-                THIS.DIE();
-            '''
-            output = run_program(source, source_file=main_path)
-            self.assertEqual(output.strip(), "Hello, World")
+        write_module(self.tmpdir, "greeter.~ATH", '''
+            BIRTH prefix WITH "Hello, ";
+            RITE greet(name) {
+                BEQUEATH prefix + name;
+            }
+            THIS.DIE();
+        ''')
+
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = f'''
+            import watcher W("{self.module_path("greeter.~ATH")}");
+            BIRTH msg WITH W.greet("World");
+            UTTER(msg);
+            THIS.DIE();
+        '''
+        output = run_program(source, source_file=main_path)
+        self.assertEqual(output.strip(), "Hello, World")
 
     def test_non_ath_watcher_no_exports(self):
         """A .txt watcher has no module behavior."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            txt_path = write_module(tmpdir, "data.txt", "some data")
-            main_path = write_module(tmpdir, "main.~ATH", '')
-
-            # Non-.~ATH watcher should not be accessible as a value
-            source = f'''
-                import watcher W("{ath_path(txt_path)}");
-                UTTER(W);
-                THIS.DIE();
-            '''
-            with self.assertRaises(TildeAthError):
-                run_program(source, source_file=main_path)
+        txt_path = write_module(self.tmpdir, "data.txt", "some data")
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+
+        # Non-.~ATH watcher should not be accessible as a value
+        source = f'''
+            import watcher W("{ath_path(txt_path)}");
+            UTTER(W);
+            THIS.DIE();
+        '''
+        with self.assertRaises(TildeAthError):
+            run_program(source, source_file=main_path)
 
     def test_circular_import_detection(self):
         """A imports B imports A -> RuntimeError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            a_path = os.path.join(tmpdir, "a.~ATH")
-            b_path = os.path.join(tmpdir, "b.~ATH")
-
-            with open(a_path, 'w') as f:
-                f.write(f'''
-                    import watcher B("{ath_path(b_path)}");
-                    THIS.DIE();
-                ''')
-
-            with open(b_path, 'w') as f:
-                f.write(f'''
-                    import watcher A("{ath_path(a_path)}");
-                    THIS.DIE();
-                ''')
-
-            source = f'''
+        a_path = os.path.join(self.tmpdir, "a.~ATH")
+        b_path = os.path.join(self.tmpdir, "b.~ATH")
+
+        write_modules(self.tmpdir, {
+            "a.~ATH": f'''
+                import watcher B("{ath_path(b_path)}");
+                THIS.DIE();
+            ''',
+            "b.~ATH": f'''
                 import watcher A("{ath_path(a_path)}");
                 THIS.DIE();
+            ''',
+        })
+
+        source = f'''
+            import watcher A("{ath_path(a_path)}");
+            THIS.DIE();
+        '''
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        with self.assertRaises(TildeAthError) as ctx:
+            run_program(source, source_file=main_path)
+        self.assertIn("Circular import", str(ctx.exception))
+
+    def test_deep_circular_import_detection(self):
+        """a0 -> a1 -> ... -> a49 -> a0 is detected quickly."""
+        depth = 50
+        write_modules(self.tmpdir, {
+            f"a{i}.~ATH": f'''
+                import watcher NEXT("{self.module_path(f"a{(i + 1) % depth}.~ATH")}");
+                THIS.DIE();
             '''
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            with self.assertRaises(TildeAthError) as ctx:
-                run_program(source, source_file=main_path)
-            self.assertIn("Circular import", str(ctx.exception))
+            for i in range(depth)
+        })
+
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = f'''
+            import watcher A("{self.module_path("a0.~ATH")}");
+            THIS.DIE();
+        '''
+        start = time.perf_counter()
+        with self.assertRaises(TildeAthError) as ctx:
+            run_program(source, source_file=main_path)
+        self.assertLess(time.perf_counter() - start, 5.0)
+        self.assertIn("Circular import", str(ctx.exception))
+        self.assertIn("a49.~ATH -> ", str(ctx.exception))
 
     def test_module_syntax_error(self):
         """Module with bad syntax raises clear error."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            write_module(tmpdir, "bad.~ATH", '''
-                BIRTH x WITH ;
-            ''')
-
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            source = f'''
-                import watcher W("{ath_path(os.path.join(tmpdir, "bad.~ATH"))}");
-                THIS.DIE();
-            '''
-            with self.assertRaises(TildeAthError) as ctx:
-                run_program(source, source_file=main_path)
-            self.assertIn("Error in module", str(ctx.exception))
+        write_module(self.tmpdir, "bad.~ATH", '''
+            BIRTH x WITH ;
+        ''')
+
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = f'''
+            import watcher W("{self.module_path("bad.~ATH")}");
+            THIS.DIE();
+        '''
+        with self.assertRaises(TildeAthError) as ctx:
+            run_program(source, source_file=main_path)
+        self.assertIn("Error in module", str(ctx.exception))
 
     def test_reimport_module(self):
         """Re-importing reloads exports from disk."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            mod_path = os.path.join(tmpdir, "counter.~ATH")
-            with open(mod_path, 'w') as f:
-                f.write('''
-                    BIRTH val WITH 1;
-                    THIS.DIE();
-                ''')
-
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            source = f'''
-                import watcher W("{ath_path(mod_path)}");
-                UTTER(W.val);
-                import watcher W("{ath_path(mod_path)}");
-                UTTER(W.val);
-                THIS.DIE();
-            '''
-            output = run_program(source, source_file=main_path)
-            lines = output.strip().split('\n')
-            self.assertEqual(lines[0], "1")
-            self.assertEqual(lines[1], "1")
+        mod_path = write_module(self.tmpdir, "counter.~ATH", '''
+            BIRTH val WITH 1;
+            THIS.DIE();
+        ''')
+
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = f'''
+            import watcher W("{ath_path(mod_path)}");
+            UTTER(W.val);
+            import watcher W("{ath_path(mod_path)}");
+            UTTER(W.val);
+            INSCRIBE("{ath_path(mod_path)}", "BIRTH val WITH 2; THIS.DIE();");
+            import watcher W("{ath_path(mod_path)}");
+            UTTER(W.val);
+            THIS.DIE();
+        '''
+        output = run_program(source, source_file=main_path)
+        self.assertEqual(output.strip().split('\n'), ["1", "1", "2"])
 
     def test_module_with_timer(self):
         """Module uses timers internally at load time."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            write_module(tmpdir, "timermod.~ATH", '''
-                BIRTH result WITH 0;
-                import timer T(1ms);
-                ~ATH(T) { } EXECUTE(result = 42;);
-                THIS.DIE();
-            ''')
-
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            source = f'''
-                import watcher W("{ath_path(os.path.join(tmpdir, "timermod.~ATH"))}");
-                UTTER(W.result);
-                THIS.DIE();
-            '''
-            output = run_program(source, source_file=main_path)
-            self.assertEqual(output.strip(), "42")
+        write_module(self.tmpdir, "timermod.~ATH", '''
+            BIRTH result WITH 0;
+            import timer T(1ms);
+            ~ATH(T) { } EXECUTE(result = 42;);
+            THIS.DIE();
+        ''')
+
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = EXPORT_PROGRAM.format(path=self.module_path("timermod.~ATH"), export="result")
+        output = run_program(source, source_file=main_path)
+        self.assertEqual(output.strip(), "42")
 
     def test_multiple_rites(self):
         """Module exports several rites, all callable."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            write_module(tmpdir, "multi.~ATH", '''
-                RITE double(x) { BEQUEATH x * 2; }
-                RITE triple(x) { BEQUEATH x * 3; }
-                RITE negate(x) { BEQUEATH 0 - x; }
-                THIS.DIE();
-            ''')
-
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            source = f'''
-                import watcher M("{ath_path(os.path.join(tmpdir, "multi.~ATH"))}");
-                UTTER(M.double(5));
-                UTTER(M.triple(5));
-                UTTER(M.negate(5));
-                THIS.DIE();
-            '''
-            output = run_program(source, source_file=main_path)
-            lines = output.strip().split('\n')
-            self.assertEqual(lines[0], "10")
-            self.assertEqual(lines[1], "15")
-            self.assertEqual(lines[2], "-5")
+        write_module(self.tmpdir, "multi.~ATH", '''
+            RITE double(x) { BEQUEATH x * 2; }
+            RITE triple(x) { BEQUEATH x * 3; }
+            RITE negate(x) { BEQUEATH 0 - x; }
+            THIS.DIE();
+        ''')
+
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = f'''
+            import watcher M("{self.module_path("multi.~ATH")}");
+            UTTER(M.double(5));
+            UTTER(M.triple(5));
+            UTTER(M.negate(5));
+            THIS.DIE();
+        '''
+        output = run_program(source, source_file=main_path)
+        lines = output.strip().split('\n')
+        self.assertEqual(lines[0], "10")
+        self.assertEqual(lines[1], "15")
+        self.assertEqual(lines[2], "-5")
 
     def test_module_typeof(self):
         """TYPEOF(W) returns 'MODULE'."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            write_module(tmpdir, "mod.~ATH", '''
-                THIS.DIE();
-            ''')
-
-            main_path = write_module(tmpdir, "main.~ATH", '')
-            source = f'''
-                import watcher W("{ath_path(os.path.join(tmpdir, "mod.~ATH"))}");
-                UTTER(TYPEOF(W));
-                THIS.DIE();
-            '''
-            output = run_program(source, source_file=main_path)
-            self.assertEqual(output.strip(), "MODULE")
+        write_module(self.tmpdir, "mod.~ATH", '''
+            THIS.DIE();
+        ''')
+
+        main_path = write_module(self.tmpdir, "main.~ATH", '')
+        source = f'''
+            import watcher W("{self.module_path("mod.~ATH")}");
+            UTTER(TYPEOF(W));
+            THIS.DIE();
+        '''
+        output = run_program(source, source_file=main_path)
+        self.assertEqual(output.strip(), "MODULE")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,86 @@
+"""Tests for load-time constant folding."""
+
+import asyncio
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from untildeath.lexer import Lexer
+from untildeath.parser import Parser
+from untildeath.interpreter import Interpreter
+from untildeath.ast_nodes import BinaryOp, Literal, UnaryOp
+from untildeath.optimize import fold_constants
+
+
+def fold(source: str):
+    """Parse and fold a program, returning its first statement's value."""
+    program = Parser(Lexer(source).tokenize()).parse()
+    interpreter = Interpreter()
+    program = fold_constants(program, interpreter._binary_op, interpreter._unary_op)
+    return program.statements[0].value
+
+
+class TestFoldConstants(unittest.TestCase):
+    """Test which expressions fold to literals."""
+
+    def test_arithmetic_folds(self):
+        value = fold("BIRTH x WITH 2 + 3 * 4;")
+        self.assertIsInstance(value, Literal)
+        self.assertEqual(value.value, 14)
+
+    def test_integer_division_matches_interpreter(self):
+        self.assertEqual(fold("BIRTH x WITH 7 / 2;").value, 3)
+
+    def test_string_concatenation_folds(self):
+        self.assertEqual(fold('BIRTH x WITH "n=" + 1;').value, "n=1")
+
+    def test_unary_folds(self):
+        self.assertEqual(fold("BIRTH x WITH ~5;").value, -6)
+        self.assertIs(fold("BIRTH x WITH NOT 0;").value, True)
+
+    def test_nested_in_containers(self):
+        value = fold("BIRTH x WITH [1 + 1, {k: 2 * 3}];")
+        self.assertEqual(value.elements[0].value, 2)
+        self.assertEqual(value.elements[1].entries[0][1].value, 6)
+
+    def test_variables_are_not_folded(self):
+        value = fold("BIRTH x WITH y + 1 * 2;")
+        self.assertIsInstance(value, BinaryOp)
+        self.assertEqual(value.right.value, 2)
+
+    def test_errors_are_left_for_run_time(self):
+        self.assertIsInstance(fold("BIRTH x WITH 1 / 0;"), BinaryOp)
+        self.assertIsInstance(fold('BIRTH x WITH 1 < "a";'), BinaryOp)
+        self.assertIsInstance(fold('BIRTH x WITH -"a";'), UnaryOp)
+
+    def test_short_circuit_and_shift_are_not_folded(self):
+        self.assertIsInstance(fold("BIRTH x WITH 1 AND 2;"), BinaryOp)
+        self.assertIsInstance(fold("BIRTH x WITH 1 << 3;"), BinaryOp)
+
+
+class TestFoldingLeavesProgramIntact(unittest.TestCase):
+    """Test that running a program never rewrites the caller's AST."""
+
+    def test_run_does_not_modify_program(self):
+        program = Parser(Lexer("BIRTH x WITH 2 + 3; THIS.DIE();").tokenize()).parse()
+        asyncio.run(Interpreter().run(program))
+        self.assertIsInstance(program.statements[0].value, BinaryOp)
+
+    def test_purity_recomputed_on_copies(self):
+        value = fold("BIRTH x WITH [f(), 1 + 2];")
+        self.assertFalse(value.pure)
+        self.assertEqual(value.elements[1].value, 3)
+
+    def test_unchanged_subtrees_are_shared(self):
+        program = Parser(Lexer("BIRTH x WITH y; BIRTH z WITH 1 + 2;").tokenize()).parse()
+        interpreter = Interpreter()
+        folded = fold_constants(program, interpreter._binary_op, interpreter._unary_op)
+        self.assertIsNot(folded, program)
+        self.assertIs(folded.statements[0], program.statements[0])
+        self.assertIsNot(folded.statements[1], program.statements[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
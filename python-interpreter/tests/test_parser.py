@@ -537,6 +537,41 @@ class TestParserPrecedence(unittest.TestCase):
         self.assertEqual(expr.right.right.right.operator, "<<")
 
 
+class TestParserPurity(unittest.TestCase):
+    """Test the pure flag that marks call-free expressions."""
+
+    def value(self, expr: str):
+        return parse(f"BIRTH x WITH {expr};").statements[0].value
+
+    def test_call_free_expressions_are_pure(self):
+        for expr in ('42', 'y', '-y', 'a + b * 2', 'm.k[0]', '[1, y]', '{k: y}'):
+            with self.subTest(expr=expr):
+                self.assertTrue(self.value(expr).pure)
+
+    def test_calls_make_enclosing_expressions_impure(self):
+        for expr in ('f()', '1 + f()', '-f()', '[1, f()]', '{k: f()}',
+                     'f().k', 'm[f()]', 'a AND f()'):
+            with self.subTest(expr=expr):
+                self.assertFalse(self.value(expr).pure)
+
+    def test_statement_purity(self):
+        program = parse("""
+            BIRTH a WITH 1 + 2;
+            ENTOMB b WITH f();
+            a = [a];
+            m[f()] = 1;
+            RITE r() { f(); }
+            a;
+            f();
+        """)
+        self.assertEqual([stmt.pure for stmt in program.statements],
+                         [True, False, True, False, True, True, False])
+
+    def test_pure_flag_ignored_by_equality(self):
+        self.assertEqual(BinaryOp('+', Literal(1), Literal(2)),
+                         BinaryOp('+', Literal(1), Literal(2)))
+
+
 class TestParserErrors(unittest.TestCase):
     """Test parser error handling."""
 
@@ -4,33 +4,30 @@
 import asyncio
 import sys
 import argparse
+from functools import cache
 from pathlib import Path
 
 from .lexer import Lexer
 from .parser import Parser
 from .interpreter import Interpreter
 from .errors import TildeAthError, DebuggerQuitException
-from .debugger import Debugger, DebuggerState
 
 
-def run_file(filepath: str, debug: bool = False) -> int:
+def run_file(filepath: str, debug: bool = False, trace: bool = False) -> int:
     """Run a !~ATH source file."""
-    path = Path(filepath)
-
-    if not path.exists():
+    try:
+        source = Path(filepath).read_text(encoding='utf-8')
+    except FileNotFoundError:
         print(f"Error: File not found: {filepath}", file=sys.stderr)
         return 1
-
-    try:
-        source = path.read_text(encoding='utf-8')
     except IOError as e:
         print(f"Error reading file: {e}", file=sys.stderr)
         return 1
 
-    return run_source(source, filepath, debug)
+    return run_source(source, filepath, debug, trace)
 
 
-def run_source(source: str, filename: str = "<stdin>", debug: bool = False) -> int:
+def run_source(source: str, filename: str = "<stdin>", debug: bool = False, trace: bool = False) -> int:
     """Run !~ATH source code."""
     try:
         # Lexical analysis
@@ -43,13 +40,18 @@ def run_source(source: str, filename: str = "<stdin>", debug: bool = False) -> i
 
         # Debugger initialization
         debugger = None
-        if debug:
+        if trace:
+            from .debugger import TraceDebugger
+            debugger = TraceDebugger(source)
+        elif debug:
+            from .debugger import Debugger
             debugger = Debugger(source)
             print(f"Debugger enabled for {filename}")
 
         # Interpretation
-        interpreter = Interpreter(debugger)
-        asyncio.run(interpreter.run(program))
+        source_file = str(Path(filename).resolve()) if filename != "<stdin>" else None
+        interpreter = Interpreter(debugger, source_file=source_file)
+        _run(interpreter.run(program))
 
         return 0
 
@@ -64,104 +66,155 @@ def run_source(source: str, filename: str = "<stdin>", debug: bool = False) -> i
         return 130
 
 
+def _cancel_pending(loop: asyncio.AbstractEventLoop):
+    """Cancel tasks left on the REPL loop by an interrupted program."""
+    tasks = asyncio.all_tasks(loop)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
 def run_repl():
     """Run an interactive REPL."""
-    print("!~ATH Interpreter v1.0.0")
-    print("Type '~ATH' code, or 'quit' to exit.")
-    print("':step' to toggle debugger for next execution.")
-    print()
+    sys.stdout.write(
+        "!~ATH interpreter v1.0.0\n"
+        "'quit' to exit.\n"
+        "':step' to toggle debugger for next execution.\n"
+        "\n"
+    )
 
     # For REPL, we accumulate code until we see a complete program
-    buffer = []
+    buffer = ""
     debug_next = False
 
-    while True:
-        try:
-            prompt = "(debug) >>> " if debug_next else ">>> "
-            if buffer:
-                prompt = "... "
+    # One interpreter keeps BIRTH/ENTOMB bindings and rites across submissions
+    interpreter = Interpreter()
+
+    # One event loop serves every submission instead of asyncio.run per run
+    loop = _new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        while True:
+            try:
+                prompt = "(debug) >>> " if debug_next else ">>> "
+                if buffer:
+                    prompt = "... "
             
-            line = input(prompt)
+                line = input(prompt)
 
-            if line.strip().lower() == 'quit':
-                break
+                if line.strip().lower() == 'quit':
+                    break
             
-            if line.strip() == ':step':
-                debug_next = not debug_next
-                print(f"Debugger {'enabled' if debug_next else 'disabled'} for next run.")
-                continue
+                if line.strip() == ':step':
+                    debug_next = not debug_next
+                    sys.stdout.write(f"Debugger {'enabled' if debug_next else 'disabled'} for next run.\n")
+                    continue
 
-            buffer.append(line)
+                # Extend the pending source in place of re-joining every line
+                buffer = f"{buffer}\n{line}" if buffer else line
 
-            # Try to parse - if incomplete, continue accumulating
-            source = '\n'.join(buffer)
+                # Try to parse - if incomplete, continue accumulating
+                source = buffer
 
-            try:
-                lexer = Lexer(source)
-                tokens = lexer.tokenize()
-                parser = Parser(tokens)
-                program = parser.parse()
+                try:
+                    lexer = Lexer(source)
+                    tokens = lexer.tokenize()
+                    parser = Parser(tokens)
+                    program = parser.parse()
 
-                # Successfully parsed - execute
-                debugger = None
-                if debug_next:
-                    debugger = Debugger(source)
+                    # Successfully parsed - execute
+                    debugger = None
+                    if debug_next:
+                        from .debugger import Debugger
+                        debugger = Debugger(source)
                 
-                interpreter = Interpreter(debugger)
-                asyncio.run(interpreter.run(program))
+                    interpreter.debugger = debugger
+                    loop.run_until_complete(interpreter.run(program))
                 
-                buffer = []
-                debug_next = False
-
-            except DebuggerQuitException:
-                print("Debugger quit.")
-                buffer = []
-                debug_next = False
-            except TildeAthError as e:
-                # Check if it might be incomplete
-                error_msg = str(e).lower()
-                if 'unexpected token: eof' in error_msg or 'expected' in error_msg:
-                    # Might be incomplete, continue accumulating
-                    continue
-                else:
-                    # Real error
-                    print(f"Error: {e}", file=sys.stderr)
-                    buffer = []
+                    buffer = ""
+                    debug_next = False  # Reset after run
+
+                except DebuggerQuitException:
+                    sys.stdout.write("Debugger quit.\n")
+                    buffer = ""
+                    debug_next = False
+                except TildeAthError as e:
+                    # Check if it might be incomplete
+                    error_msg = str(e).lower()
+                    if 'unexpected token: eof' in error_msg or 'expected' in error_msg:
+                        # Might be incomplete, continue accumulating
+                        continue
+                    else:
+                        # Real error
+                        sys.stderr.write(f"Error: {e}\n")
+                        buffer = ""
+
+            except EOFError:
+                sys.stdout.write("\n")
+                break
+            except KeyboardInterrupt:
+                sys.stdout.write("\nInterrupted. Type 'quit' to exit.\n")
+                _cancel_pending(loop)
+                buffer = ""
+    finally:
+        _cancel_pending(loop)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        # Joins the worker thread the debugger's input reads run on
+        loop.run_until_complete(loop.shutdown_default_executor())
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+# uvloop is optional (the "uvloop" extra); programs run on its event loop
+# when it is installed. The loops are created explicitly rather than through
+# an event loop policy, which Python 3.14 deprecates.
+
+def _run(main):
+    """Run a coroutine to completion on a new event loop, like asyncio.run."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
 
-        except EOFError:
-            print()
-            break
-        except KeyboardInterrupt:
-            print("\nInterrupted. Type 'quit' to exit.")
-            buffer = []
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop for the REPL."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
 
-def main():
-    """Main entry point."""
+
+@cache
+def _get_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once per process."""
     parser = argparse.ArgumentParser(description="!~ATH Interpreter")
     parser.add_argument("file", nargs="?", help="Source file to run")
     parser.add_argument("--step", "-d", "--debug", action="store_true", help="Enable stepping debugger (CLI)")
     parser.add_argument("--tui", action="store_true", help="Enable TUI debugger (Textual)")
     parser.add_argument("--trace", action="store_true", help="Enable non-interactive JSON trace mode")
-    
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point."""
+    args = _get_arg_parser().parse_args()
     
     if args.tui:
         # Run TUI (with or without a file)
         from .tui import AthDebuggerApp
-        from .interpreter import Interpreter
 
         try:
             if args.file:
-                from .lexer import Lexer
-                from .parser import Parser
-
-                path = Path(args.file)
-                if not path.exists():
+                try:
+                    source = Path(args.file).read_text(encoding='utf-8')
+                except FileNotFoundError:
                     print(f"Error: File not found: {args.file}", file=sys.stderr)
                     sys.exit(1)
 
-                source = path.read_text(encoding='utf-8')
                 lexer = Lexer(source)
                 tokens = lexer.tokenize()
                 parser = Parser(tokens)
@@ -176,7 +229,8 @@ def main():
         except Exception as e:
             print(f"Error starting TUI: {e}", file=sys.stderr)
             sys.exit(1)
-    elif args.file:
+
+    if args.file:
         sys.exit(run_file(args.file, debug=args.step, trace=args.trace))
     else:
         run_repl()
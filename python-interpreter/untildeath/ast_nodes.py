@@ -4,6 +4,18 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Union, Any
 
 
+# A node is pure when no rite call occurs anywhere inside it, so the
+# interpreter can evaluate or execute it without awaiting. Nodes are built
+# bottom-up, so each one works this out from its children once, at
+# construction.
+def pure_field(default: bool = False):
+    return field(default=default, init=False, repr=False, compare=False)
+
+
+def is_pure(node: Any) -> bool:
+    return getattr(node, 'pure', False)
+
+
 # ============ Statements ============
 
 @dataclass
@@ -61,6 +73,10 @@ class VarDecl:
     value: 'Expression' = None
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+
+    def __post_init__(self):
+        self.pure = is_pure(self.value)
 
 
 @dataclass
@@ -69,6 +85,10 @@ class ConstDecl:
     value: 'Expression' = None
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+
+    def __post_init__(self):
+        self.pure = is_pure(self.value)
 
 
 @dataclass
@@ -77,6 +97,10 @@ class Assignment:
     value: 'Expression' = None
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+
+    def __post_init__(self):
+        self.pure = is_pure(self.target) and is_pure(self.value)
 
 
 @dataclass
@@ -86,6 +110,7 @@ class RiteDef:
     body: List[Statement] = field(default_factory=list)
     line: int = 0
     column: int = 0
+    pure: bool = pure_field(True)  # defining never runs the body
 
 
 @dataclass
@@ -125,6 +150,10 @@ class ExprStmt:
     expression: 'Expression' = None
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+
+    def __post_init__(self):
+        self.pure = is_pure(self.expression)
 
 
 # ============ Entity Expressions ============
@@ -191,11 +220,16 @@ Expression = Union[
 ]
 
 
+# Milliseconds per Duration unit
+DURATION_UNIT_MS = {'ms': 1, 's': 1000, 'm': 60 * 1000, 'h': 60 * 60 * 1000}
+
+
 @dataclass
 class Literal:
     value: Any = None  # int, float, str, bool, None
     line: int = 0
     column: int = 0
+    pure: bool = pure_field(True)
 
 
 @dataclass
@@ -203,6 +237,7 @@ class Identifier:
     name: str = ""
     line: int = 0
     column: int = 0
+    pure: bool = pure_field(True)
 
 
 @dataclass
@@ -212,6 +247,10 @@ class BinaryOp:
     right: 'Expression' = None
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+
+    def __post_init__(self):
+        self.pure = is_pure(self.left) and is_pure(self.right)
 
 
 @dataclass
@@ -220,6 +259,10 @@ class UnaryOp:
     operand: 'Expression' = None
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+
+    def __post_init__(self):
+        self.pure = is_pure(self.operand)
 
 
 @dataclass
@@ -228,6 +271,7 @@ class CallExpr:
     args: List['Expression'] = field(default_factory=list)
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
 
 
 @dataclass
@@ -236,6 +280,10 @@ class IndexExpr:
     index: 'Expression' = None
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+
+    def __post_init__(self):
+        self.pure = is_pure(self.obj) and is_pure(self.index)
 
 
 @dataclass
@@ -244,6 +292,10 @@ class MemberExpr:
     member: str = ""
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+
+    def __post_init__(self):
+        self.pure = is_pure(self.obj)
 
 
 @dataclass
@@ -251,6 +303,10 @@ class ArrayLiteral:
     elements: List['Expression'] = field(default_factory=list)
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+
+    def __post_init__(self):
+        self.pure = all(is_pure(element) for element in self.elements)
 
 
 @dataclass
@@ -258,6 +314,10 @@ class MapLiteral:
     entries: List[tuple] = field(default_factory=list)  # List of (key: str, value: Expression)
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+
+    def __post_init__(self):
+        self.pure = all(is_pure(value) for _, value in self.entries)
 
 
 @dataclass
@@ -266,3 +326,9 @@ class Duration:
     value: int = 0
     line: int = 0
     column: int = 0
+    pure: bool = pure_field()
+    ms: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Unknown units count as milliseconds
+        self.ms = self.value * DURATION_UNIT_MS.get(self.unit, 1)
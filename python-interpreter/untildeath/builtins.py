@@ -1,18 +1,55 @@
 """Built-in rites (functions) for !~ATH."""
 
-import random
 import sys
 import time
-from typing import Any, List
+from types import MappingProxyType
+from typing import Any, List, Mapping
 
 from .errors import RuntimeError
 
+# Elements are dispatched on the exact-type table inline, so primitive
+# members skip the call into stringify() and go straight to their converter
+def _stringify_list(value: list) -> str:
+    get = _STRINGIFY.get
+    return "[" + ", ".join([(get(type(v)) or stringify)(v) for v in value]) + "]"
+
+
+def _stringify_dict(value: dict) -> str:
+    get = _STRINGIFY.get
+    entries = ", ".join([f"{k}: {(get(type(v)) or stringify)(v)}"
+                         for k, v in value.items()])
+    return "{" + entries + "}"
+
+
+# Exact-type fast paths; subclasses and entities take the isinstance route
+_STRINGIFY = {
+    type(None): lambda value: "VOID",
+    bool: lambda value: "ALIVE" if value else "DEAD",
+    int: str,
+    float: str,
+    str: str,
+    list: _stringify_list,
+    dict: _stringify_dict,
+}
+
+_TYPE_NAMES = {
+    type(None): "VOID",
+    bool: "BOOLEAN",
+    int: "INTEGER",
+    float: "FLOAT",
+    str: "STRING",
+    list: "ARRAY",
+    dict: "MAP",
+}
+
 
 def stringify(value: Any) -> str:
     """Convert a value to its string representation."""
+    convert = _STRINGIFY.get(type(value))
+    if convert is not None:
+        return convert(value)
+
     from .entities import Entity, WatcherEntity
-    if value is None:
-        return "VOID"
     if isinstance(value, bool):
         return "ALIVE" if value else "DEAD"
     if isinstance(value, WatcherEntity) and value.is_module:
@@ -20,18 +57,19 @@ def stringify(value: Any) -> str:
     if isinstance(value, Entity):
         return f"<entity {value.name}>"
     if isinstance(value, list):
-        return "[" + ", ".join(stringify(v) for v in value) + "]"
+        return _stringify_list(value)
     if isinstance(value, dict):
-        entries = ", ".join(f"{k}: {stringify(v)}" for k, v in value.items())
-        return "{" + entries + "}"
+        return _stringify_dict(value)
     return str(value)
 
 
 def type_name(value: Any) -> str:
     """Get the type name of a value."""
+    name = _TYPE_NAMES.get(type(value))
+    if name is not None:
+        return name
+
     from .entities import WatcherEntity
-    if value is None:
-        return "VOID"
     if isinstance(value, bool):
         return "BOOLEAN"
     if isinstance(value, WatcherEntity) and value.is_module:
@@ -50,18 +88,13 @@ def type_name(value: Any) -> str:
 
 
 def is_truthy(value: Any) -> bool:
-    """Determine if a value is truthy."""
-    if value is None:
-        return False
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return value != 0
-    if isinstance(value, str):
-        return len(value) > 0
-    if isinstance(value, (list, dict)):
-        return len(value) > 0
-    return True
+    """Determine if a value is truthy.
+
+    VOID, DEAD, zero and empty strings, arrays and maps are false; every
+    other value (including entities and rites) is true, which is exactly
+    Python's own truth test for these types.
+    """
+    return bool(value)
 
 
 class Builtins:
@@ -70,10 +103,8 @@ class Builtins:
     def __init__(self, interpreter):
         self.interpreter = interpreter
         self._input_buffer = []
-
-    def get(self, name: str):
-        """Get a built-in function by name."""
-        builtins = {
+        # Name -> bound method, built once rather than on every lookup
+        self._table = {
             # I/O
             'UTTER': self.utter,
             'HEED': self.heed,
@@ -122,14 +153,21 @@ class Builtins:
             'RANDOM_INT': self.random_int,
             'TIME': self.time,
         }
-        return builtins.get(name)
+
+    def get(self, name: str):
+        """Get a built-in function by name."""
+        return self._table.get(name)
+
+    @property
+    def table(self) -> Mapping[str, Any]:
+        """Read-only view of every built-in function, by name."""
+        return MappingProxyType(self._table)
 
     # ============ I/O ============
 
     def utter(self, *args) -> None:
         """Print values to stdout."""
-        output = " ".join(stringify(arg) for arg in args)
-        print(output)
+        print(" ".join([stringify(arg) for arg in args]))
         return None
 
     def heed(self) -> str:
@@ -152,7 +190,7 @@ class Builtins:
         except FileNotFoundError:
             raise RuntimeError(f"File not found: {path}")
         except IOError as e:
-            raise RuntimeError(f"Cannot read file: {e}")
+            raise RuntimeError(f"Cannot read file: {path} ({e.strerror or e})")
 
     def inscribe(self, path: str, content: str) -> None:
         """Write content to file."""
@@ -253,7 +291,10 @@ class Builtins:
         """Add element to end of array."""
         if not isinstance(arr, list):
             raise RuntimeError(f"APPEND expects array, got {type_name(arr)}")
-        return arr + [value]
+        # Copy, then append: no temporary one-element list as with arr + [value]
+        result = arr.copy()
+        result.append(value)
+        return result
 
     def prepend(self, arr: list, value: Any) -> list:
         """Add element to beginning of array."""
@@ -343,7 +384,11 @@ class Builtins:
             raise RuntimeError(f"JOIN expects array, got {type_name(arr)}")
         if not isinstance(delimiter, str):
             raise RuntimeError(f"JOIN expects string delimiter, got {type_name(delimiter)}")
-        return delimiter.join(stringify(v) if not isinstance(v, str) else v for v in arr)
+        try:
+            # All-string arrays join directly in C
+            return delimiter.join(arr)
+        except TypeError:
+            return delimiter.join([v if type(v) is str else stringify(v) for v in arr])
 
     def substring(self, s: str, start: int, end: int) -> str:
         """Extract substring."""
@@ -381,12 +426,15 @@ class Builtins:
 
     def random(self) -> float:
         """Random float between 0 and 1."""
+        # random pulls in hashlib and friends; most programs never need it
+        import random
         return random.random()
 
     def random_int(self, min_val: int, max_val: int) -> int:
         """Random integer in range (inclusive)."""
         if not isinstance(min_val, int) or not isinstance(max_val, int):
             raise RuntimeError("RANDOM_INT expects two integers")
+        import random
         return random.randint(min_val, max_val)
 
     def time(self) -> int:
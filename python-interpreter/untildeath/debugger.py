@@ -1,7 +1,7 @@
 """Stepping debugger for the !~ATH interpreter."""
 
 import asyncio
-import concurrent.futures
+import re
 import sys
 import json
 from dataclasses import dataclass, asdict
@@ -22,6 +22,36 @@ STATEMENT_TYPES = (
     AttemptSalvage, CondemnStmt, BequeathStmt, ExprStmt
 )
 
+# Same classes for exact-type membership tests in the per-node hooks
+STATEMENT_TYPE_SET = frozenset(STATEMENT_TYPES)
+
+# "s5" / "step 5": run that many statements before pausing again
+STEP_COUNT_RE = re.compile(r's(?:tep)?\s*(\d+)')
+
+
+def _describe_ath_loop(node: AthLoop) -> str:
+    if isinstance(node.entity_expr, str):  # Branch mode logic might pass string
+        return f"Executing branch '{node.entity_expr}'"
+    return "~ATH loop waiting on entity"
+
+
+# Statement class -> human-readable description, for the step display
+NODE_DESCRIBERS = {
+    ImportStmt: lambda node: f"Importing {node.entity_type} entity '{node.name}'",
+    BifurcateStmt: lambda node: f"Bifurcating '{node.entity}' into '{node.branch1}' and '{node.branch2}'",
+    AthLoop: _describe_ath_loop,
+    DieStmt: lambda node: "Invoking .DIE()",
+    VarDecl: lambda node: f"Declaring variable '{node.name}'",
+    ConstDecl: lambda node: f"Declaring constant '{node.name}'",
+    Assignment: lambda node: "Assignment",
+    RiteDef: lambda node: f"Defining rite '{node.name}'",
+    Conditional: lambda node: "Conditional check (SHOULD)",
+    AttemptSalvage: lambda node: "Entering ATTEMPT block",
+    CondemnStmt: lambda node: "Throwing error (CONDEMN)",
+    BequeathStmt: lambda node: "Returning value (BEQUEATH)",
+    ExprStmt: lambda node: "Expression statement",
+}
+
 
 class DebuggerState(Enum):
     """State of the debugger."""
@@ -45,13 +75,12 @@ class StepInfo:
 class AsyncInputHandler:
     """Handles user input without blocking the asyncio event loop."""
 
-    def __init__(self):
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-
     async def get_input(self, prompt: str) -> str:
         """Get input from stdin asynchronously."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, input, prompt)
+        # The loop's default executor starts its worker lazily and is shut
+        # down with the loop (by asyncio.run, or the REPL's cleanup), so no
+        # dedicated thread outlives the session.
+        return await asyncio.to_thread(input, prompt)
 
 
 class Debugger:
@@ -62,6 +91,7 @@ class Debugger:
         self.source_lines = source_code.splitlines()
         self.input_handler = AsyncInputHandler()
         self.last_command = "step"  # Default command for empty input
+        self.steps_to_skip = 0  # Statements left to run before the next pause
 
     async def step_hook(self, node: Any, scope: 'Scope', branch_context: str, interpreter: 'Interpreter') -> bool:
         """
@@ -69,7 +99,7 @@ class Debugger:
         Returns False if execution should abort (QUIT), True otherwise.
         """
         # Only pause on statements, not expressions (unless they are ExprStmt)
-        if not isinstance(node, STATEMENT_TYPES):
+        if type(node) not in STATEMENT_TYPE_SET:
             return True
 
         # If we are just running, don't pause
@@ -78,6 +108,10 @@ class Debugger:
 
         # If we are stepping, pause and show info
         if self.state == DebuggerState.STEPPING:
+            if self.steps_to_skip:
+                self.steps_to_skip -= 1
+                return True
+
             self.state = DebuggerState.PAUSED
             
             step_info = self._create_step_info(node, branch_context)
@@ -93,7 +127,7 @@ class Debugger:
                     else:
                         cmd = cmd_input.lower()
                         # Only update last_command for execution actions
-                        if cmd in ('s', 'step', 'c', 'continue'):
+                        if cmd in ('s', 'step', 'c', 'continue') or STEP_COUNT_RE.fullmatch(cmd):
                             self.last_command = cmd
 
                     await self.process_command(cmd, scope, interpreter)
@@ -127,36 +161,10 @@ class Debugger:
 
     def _describe_node(self, node: Any) -> str:
         """Generate a human-readable description of the node."""
-        if isinstance(node, ImportStmt):
-            return f"Importing {node.entity_type} entity '{node.name}'"
-        if isinstance(node, BifurcateStmt):
-            return f"Bifurcating '{node.entity}' into '{node.branch1}' and '{node.branch2}'"
-        if isinstance(node, AthLoop):
-            if isinstance(node.entity_expr, str): # Branch mode logic might pass string
-                 return f"Executing branch '{node.entity_expr}'"
-            # Attempt to stringify entity expr roughly
-            return f"~ATH loop waiting on entity"
-        if isinstance(node, DieStmt):
-            return "Invoking .DIE()"
-        if isinstance(node, VarDecl):
-            return f"Declaring variable '{node.name}'"
-        if isinstance(node, ConstDecl):
-            return f"Declaring constant '{node.name}'"
-        if isinstance(node, Assignment):
-            return "Assignment"
-        if isinstance(node, RiteDef):
-            return f"Defining rite '{node.name}'"
-        if isinstance(node, Conditional):
-            return "Conditional check (SHOULD)"
-        if isinstance(node, AttemptSalvage):
-            return "Entering ATTEMPT block"
-        if isinstance(node, CondemnStmt):
-            return "Throwing error (CONDEMN)"
-        if isinstance(node, BequeathStmt):
-            return "Returning value (BEQUEATH)"
-        if isinstance(node, ExprStmt):
-            return "Expression statement"
-        return str(node)
+        describe = NODE_DESCRIBERS.get(type(node))
+        if describe is None:
+            return str(node)
+        return describe(node)
 
     def _display_step(self, info: StepInfo, scope: 'Scope', interpreter: 'Interpreter'):
         """Print the step display."""
@@ -167,11 +175,9 @@ class Debugger:
         if info.source_line:
             print("SOURCE:")
             print(f"   {info.line} | {info.source_line}")
-            # Identify indentation to place marker correctly
-            indent = len(info.source_line) - len(info.source_line.lstrip())
+            # Columns are 1-based positions in the raw line, so the marker
+            # needs no adjustment for the line's own indentation
             marker_indent = max(0, info.column - 1)
-            # Adjust if column is absolute vs relative to code
-            # But usually column from parser is 1-based index in line
             print(" " * (6 + marker_indent) + "^^^^^")
         
         print(f"\nSTATEMENT: {info.node_type}")
@@ -208,6 +214,11 @@ class Debugger:
             # Actually, to exit the loop in step_hook, we need to change state from PAUSED
             # If we set it to STEPPING, the loop condition (state == PAUSED) becomes false.
             pass
+
+        elif match := STEP_COUNT_RE.fullmatch(cmd):
+            self.state = DebuggerState.STEPPING
+            # This statement counts as the first of the N steps
+            self.steps_to_skip = max(0, int(match.group(1)) - 1)
             
         elif cmd in ('c', 'continue'):
             self.state = DebuggerState.RUNNING
@@ -254,6 +265,7 @@ class Debugger:
         elif cmd in ('h', 'help', '?'):
             print("\n--- DEBUGGER HELP ---")
             print("  (Enter) / s / step   : Execute next statement")
+            print("  sN / step N          : Execute N statements, then pause")
             print("  c / continue         : Resume execution until next breakpoint or end")
             print("  v / variables        : Show all variables in current scope chain")
             print("  e / entities         : Show all entities and their status")
@@ -271,7 +283,7 @@ class TraceDebugger(Debugger):
     """Non-interactive debugger that traces execution to stderr as JSON."""
 
     async def step_hook(self, node: Any, scope: 'Scope', branch_context: str, interpreter: 'Interpreter') -> bool:
-        if not isinstance(node, STATEMENT_TYPES):
+        if type(node) not in STATEMENT_TYPE_SET:
             return True
 
         step_info = self._create_step_info(node, branch_context)
@@ -5,15 +5,41 @@ import os
 from abc import ABC, abstractmethod
 from typing import Optional
 
+# Seconds between checks for deleted watched files
+WATCH_POLL_INTERVAL = 0.1
+
+# Directories with more watched names than this are listed with one
+# os.scandir per poll instead of one stat per name
+SCANDIR_THRESHOLD = 16
+
+# Bytes drained per read while a connection entity waits for EOF
+CONNECTION_READ_SIZE = 64 * 1024
+
+# The event loop keeps only weak references to tasks; this set holds
+# background tasks created here until they finish
+_live_tasks: set = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Create a task that stays referenced until it is done."""
+    task = asyncio.create_task(coro)
+    _live_tasks.add(task)
+    task.add_done_callback(_live_tasks.discard)
+    return task
+
 
 class Entity(ABC):
     """Base class for all entities."""
 
+    __slots__ = ('name', '_dead', '_death_event', '_task', '_death_callbacks')
+
     def __init__(self, name: str):
         self.name = name
         self._dead = False
-        self._death_event = asyncio.Event()
+        # Created by the first wait_for_death(); most entities die unwatched
+        self._death_event: Optional[asyncio.Event] = None
         self._task: Optional[asyncio.Task] = None
+        self._death_callbacks: list = []
 
     @property
     def is_dead(self) -> bool:
@@ -27,12 +53,34 @@ class Entity(ABC):
         """Mark this entity as dead and notify waiters."""
         if not self._dead:
             self._dead = True
-            self._death_event.set()
+            if self._death_event is not None:
+                self._death_event.set()
+            callbacks, self._death_callbacks = self._death_callbacks, []
+            for callback in callbacks:
+                callback()
             if self._task and not self._task.done():
                 self._task.cancel()
 
+    def on_death(self, callback):
+        """Call callback() when this entity dies, or now if it already has."""
+        if self._dead:
+            callback()
+        else:
+            self._death_callbacks.append(callback)
+
+    def remove_death_callback(self, callback):
+        """Forget a callback registered with on_death, if still pending."""
+        try:
+            self._death_callbacks.remove(callback)
+        except ValueError:
+            pass
+
     async def wait_for_death(self):
         """Wait until this entity dies."""
+        if self._dead:
+            return
+        if self._death_event is None:
+            self._death_event = asyncio.Event()
         await self._death_event.wait()
 
     @abstractmethod
@@ -44,6 +92,8 @@ class Entity(ABC):
 class ThisEntity(Entity):
     """The program entity (THIS)."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__('THIS')
 
@@ -55,22 +105,31 @@ class ThisEntity(Entity):
 class TimerEntity(Entity):
     """Timer that dies after a duration."""
 
+    __slots__ = ('duration_ms', '_handle')
+
     def __init__(self, name: str, duration_ms: int):
         super().__init__(name)
         self.duration_ms = duration_ms
+        self._handle: Optional[asyncio.TimerHandle] = None
 
     async def start(self):
         """Start the timer countdown."""
-        try:
-            await asyncio.sleep(self.duration_ms / 1000.0)
-            self.die()
-        except asyncio.CancelledError:
-            pass
+        # The loop's timer heap calls die(); no task sleeps out the delay
+        self._handle = asyncio.get_running_loop().call_later(
+            self.duration_ms / 1000.0, self.die
+        )
+
+    def die(self):
+        if self._handle is not None:
+            self._handle.cancel()
+        super().die()
 
 
 class ProcessEntity(Entity):
     """Process that dies when the subprocess exits."""
 
+    __slots__ = ('command', 'args', '_process')
+
     def __init__(self, name: str, command: str, args: list):
         super().__init__(name)
         self.command = command
@@ -94,6 +153,8 @@ class ProcessEntity(Entity):
 class ConnectionEntity(Entity):
     """TCP connection that dies when closed."""
 
+    __slots__ = ('host', 'port', '_reader', '_writer')
+
     def __init__(self, name: str, host: str, port: int):
         super().__init__(name)
         self.host = host
@@ -107,30 +168,31 @@ class ConnectionEntity(Entity):
             self._reader, self._writer = await asyncio.open_connection(
                 self.host, self.port
             )
-            # Wait until the connection is closed
-            while True:
-                data = await self._reader.read(1024)
-                if not data:
-                    break
+            # Wait until the connection is closed; incoming data is
+            # discarded, so drain it in large chunks
+            while await self._reader.read(CONNECTION_READ_SIZE):
+                pass
             self.die()
         except (OSError, asyncio.CancelledError, ConnectionRefusedError):
             self.die()
         finally:
             if self._writer:
                 self._writer.close()
+                # A second cancellation must not abandon a half-closed socket
                 try:
-                    await self._writer.wait_closed()
-                except Exception:
+                    await asyncio.shield(self._writer.wait_closed())
+                except (Exception, asyncio.CancelledError):
                     pass
 
 
 class WatcherEntity(Entity):
     """File watcher that dies when the file is deleted."""
 
+    __slots__ = ('filepath', 'exports', 'is_module')
+
     def __init__(self, name: str, filepath: str):
         super().__init__(name)
         self.filepath = filepath
-        self._poll_interval = 0.1  # 100ms polling
         self.exports: dict = {}       # populated by interpreter after module execution
         self.is_module: bool = False  # True if filepath ends with .~ATH
 
@@ -139,23 +201,90 @@ class WatcherEntity(Entity):
         try:
             # Check if file exists initially
             if not os.path.exists(self.filepath):
-                # File doesn't exist, die immediately (via event loop)
-                await asyncio.sleep(0)
-                self.die()
+                # File doesn't exist, die on the next loop iteration
+                asyncio.get_running_loop().call_soon(self.die)
                 return
 
-            # Poll for file deletion
-            while os.path.exists(self.filepath):
-                await asyncio.sleep(self._poll_interval)
-
-            self.die()
+            # The directory's shared poll calls die() once the file is gone
+            _watch(self)
+            try:
+                await self.wait_for_death()
+            finally:
+                _unwatch(self)
         except asyncio.CancelledError:
             pass
 
 
+class _DirWatch:
+    """Single polling task for every watcher on files in one directory."""
+
+    def __init__(self, dirname: str):
+        self.dirname = dirname
+        self.subscribers: dict[str, list[WatcherEntity]] = {}
+        self.task = _spawn(self._poll())
+
+    def _missing(self) -> list:
+        """Watched names that no longer exist in the directory."""
+        if len(self.subscribers) <= SCANDIR_THRESHOLD:
+            return [name for name in self.subscribers
+                    if not os.path.exists(os.path.join(self.dirname, name))]
+        try:
+            with os.scandir(self.dirname) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        # A listing compares names exactly; confirm misses with a stat so
+        # case-insensitive filesystems don't report false deletions
+        return [name for name in self.subscribers
+                if name not in present
+                and not os.path.exists(os.path.join(self.dirname, name))]
+
+    async def _poll(self):
+        try:
+            while self.subscribers:
+                await asyncio.sleep(WATCH_POLL_INTERVAL)
+                for name in self._missing():
+                    for watcher in self.subscribers.pop(name, ()):
+                        watcher.die()
+        finally:
+            if _watch_registry.get(self.dirname) is self:
+                del _watch_registry[self.dirname]
+
+
+# Directory -> shared poll, so N watchers in one directory cost one task
+_watch_registry: dict[str, _DirWatch] = {}
+
+
+def _watch(watcher: WatcherEntity):
+    """Subscribe a watcher to its directory's shared poll."""
+    dirname, name = os.path.split(os.path.abspath(watcher.filepath))
+    watch = _watch_registry.get(dirname)
+    if watch is None or watch.task.get_loop() is not asyncio.get_running_loop():
+        watch = _watch_registry[dirname] = _DirWatch(dirname)
+    watch.subscribers.setdefault(name, []).append(watcher)
+
+
+def _unwatch(watcher: WatcherEntity):
+    """Drop a watcher; the directory's poll stops with its last subscriber."""
+    dirname, name = os.path.split(os.path.abspath(watcher.filepath))
+    watch = _watch_registry.get(dirname)
+    if watch is None:
+        return
+    watchers = watch.subscribers.get(name)
+    if watchers and watcher in watchers:
+        watchers.remove(watcher)
+        if not watchers:
+            del watch.subscribers[name]
+    if not watch.subscribers:
+        del _watch_registry[dirname]
+        watch.task.cancel()
+
+
 class BranchEntity(Entity):
     """Branch entity created by bifurcation."""
 
+    __slots__ = ('_complete',)
+
     def __init__(self, name: str):
         super().__init__(name)
         self._complete = asyncio.Event()
@@ -177,6 +306,8 @@ class BranchEntity(Entity):
 class CompositeEntity(Entity):
     """Entity combining multiple entities with AND/OR/NOT."""
 
+    __slots__ = ('op', 'entities')
+
     def __init__(self, name: str, op: str, entities: list):
         super().__init__(name)
         self.op = op  # 'AND', 'OR', 'NOT'
@@ -185,25 +316,37 @@ class CompositeEntity(Entity):
     async def start(self):
         """Wait based on the composition logic."""
         try:
-            if self.op == 'AND':
-                # Wait for all entities to die
-                await asyncio.gather(
-                    *[e.wait_for_death() for e in self.entities]
-                )
-                self.die()
-            elif self.op == 'OR':
-                # Wait for any entity to die
-                done, pending = await asyncio.wait(
-                    [asyncio.create_task(e.wait_for_death()) for e in self.entities],
-                    return_when=asyncio.FIRST_COMPLETED
-                )
-                for task in pending:
-                    task.cancel()
+            if self.op in ('AND', 'OR'):
+                # Children report their deaths through one shared future
+                # instead of a waiting task each
+                await self._wait_for_children(1 if self.op == 'OR' else len(self.entities))
                 self.die()
             elif self.op == 'NOT':
                 # Die immediately (the entity exists)
                 # The 'NOT' entity dies when the entity is created
-                await asyncio.sleep(0)
-                self.die()
+                asyncio.get_running_loop().call_soon(self.die)
         except asyncio.CancelledError:
             pass
+
+    async def _wait_for_children(self, needed: int):
+        """Wait until `needed` of the child entities have died."""
+        # Children that are already dead settle the count without waiting
+        alive = [entity for entity in self.entities if not entity._dead]
+        remaining = needed - (len(self.entities) - len(alive))
+        if remaining <= 0:
+            return
+        done = asyncio.get_running_loop().create_future()
+
+        def on_child_death():
+            nonlocal remaining
+            remaining -= 1
+            if remaining <= 0 and not done.done():
+                done.set_result(None)
+
+        try:
+            for entity in alive:
+                entity.on_death(on_child_death)
+            await done
+        finally:
+            for entity in alive:
+                entity.remove_death_callback(on_child_death)
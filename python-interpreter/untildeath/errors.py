@@ -11,11 +11,11 @@ class TildeAthError(Exception):
         super().__init__(self._format_message())
 
     def _format_message(self) -> str:
-        if self.line is not None:
-            if self.column is not None:
-                return f"[line {self.line}, col {self.column}] {self.message}"
+        if self.line is None:
+            return self.message
+        if self.column is None:
             return f"[line {self.line}] {self.message}"
-        return self.message
+        return f"[line {self.line}, col {self.column}] {self.message}"
 
 
 class LexerError(TildeAthError):
@@ -41,9 +41,10 @@ class CondemnError(RuntimeError):
 class BequeathError(Exception):
     """Control flow for BEQUEATH (not a real error)."""
 
+    # Raised once per BEQUEATH, so it skips Exception.__init__; the
+    # exception's args are never read
     def __init__(self, value):
         self.value = value
-        super().__init__()
 
 
 class DebuggerQuitException(Exception):
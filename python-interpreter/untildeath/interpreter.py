@@ -1,7 +1,9 @@
 """Interpreter for the !~ATH language."""
 
 import asyncio
+import operator
 import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set
 import contextvars
 
@@ -24,6 +26,7 @@ from .entities import (
 )
 from .builtins import Builtins, is_truthy, stringify
 from .errors import RuntimeError, CondemnError, BequeathError, DebuggerQuitException
+from .optimize import fold_constants
 
 # Avoid circular import for type hinting
 from typing import TYPE_CHECKING
@@ -31,6 +34,15 @@ if TYPE_CHECKING:
     from .debugger import Debugger, DebuggerState
 
 
+@lru_cache(maxsize=64)
+def _parse_module(source: str) -> Program:
+    """Lex and parse a module's source text."""
+    from .lexer import Lexer
+    from .parser import Parser
+
+    return Parser(Lexer(source).tokenize()).parse()
+
+
 class Scope:
     """Variable scope."""
 
@@ -44,30 +56,31 @@ class Scope:
         if constant:
             self.constants.add(name)
 
+    def resolve(self, name: str) -> Optional['Scope']:
+        """Return the innermost scope defining name, or None."""
+        scope = self
+        while scope is not None:
+            if name in scope.variables:
+                return scope
+            scope = scope.parent
+        return None
+
     def get(self, name: str) -> Any:
-        if name in self.variables:
-            return self.variables[name]
-        if self.parent:
-            return self.parent.get(name)
-        raise RuntimeError(f"Undefined variable: {name}")
+        scope = self.resolve(name)
+        if scope is None:
+            raise RuntimeError(f"Undefined variable: {name}")
+        return scope.variables[name]
 
     def set(self, name: str, value: Any):
-        if name in self.variables:
-            if name in self.constants:
-                raise RuntimeError(f"Cannot reassign constant: {name}")
-            self.variables[name] = value
-            return
-        if self.parent:
-            self.parent.set(name, value)
-            return
-        raise RuntimeError(f"Undefined variable: {name}")
+        scope = self.resolve(name)
+        if scope is None:
+            raise RuntimeError(f"Undefined variable: {name}")
+        if name in scope.constants:
+            raise RuntimeError(f"Cannot reassign constant: {name}")
+        scope.variables[name] = value
 
     def has(self, name: str) -> bool:
-        if name in self.variables:
-            return True
-        if self.parent:
-            return self.parent.has(name)
-        return False
+        return self.resolve(name) is not None
 
 
 class UserRite:
@@ -90,22 +103,100 @@ class Interpreter:
         self.branch_entities: Set[str] = set()  # Track which identifiers are branches
         self.builtins = Builtins(self)
         self.this_entity: Optional[ThisEntity] = None
-        self._pending_tasks: List[asyncio.Task] = []
+        # THIS and the builtins take precedence over every variable, so they
+        # share one table checked first; THIS is added by run()
+        self._fixed_names: Dict[str, Any] = dict(self.builtins.table)
+        self._pending_tasks: Set[asyncio.Task] = set()  # unfinished tasks only
         self.debugger = debugger
         self.source_file = source_file        # absolute path of current file (None for REPL)
-        self._import_stack: list = []         # absolute paths for circular import detection
+        self._base_dir = os.path.dirname(source_file) if source_file else os.getcwd()
+        self._path_cache: Dict[str, str] = {}  # import filepath -> resolved path
+        self._import_stack: list = []         # absolute paths, in import order, for error messages
+        self._import_paths: frozenset = frozenset()  # same paths, for O(1) circular import checks
         # self._current_branch is now managed via contextvars
+        # Node type -> handler; AST classes are never subclassed, so the
+        # exact type is enough to pick the handler
+        self._exec_dispatch = {
+            ImportStmt: self.exec_import,
+            BifurcateStmt: self.exec_bifurcate,
+            AthLoop: self.exec_ath_loop,
+            DieStmt: self.exec_die,
+            VarDecl: self.exec_var_decl,
+            ConstDecl: self.exec_const_decl,
+            Assignment: self.exec_assignment,
+            RiteDef: self.exec_rite_def,
+            Conditional: self.exec_conditional,
+            AttemptSalvage: self.exec_attempt_salvage,
+            CondemnStmt: self.exec_condemn,
+            BequeathStmt: self.exec_bequeath,
+            ExprStmt: self.exec_expr_stmt,
+        }
+        self._eval_dispatch = {
+            BinaryOp: self.eval_binary_op,
+            UnaryOp: self.eval_unary_op,
+            CallExpr: self.eval_call,
+            IndexExpr: self.eval_index,
+            MemberExpr: self.eval_member,
+            ArrayLiteral: self.eval_array_literal,
+            MapLiteral: self.eval_map_literal,
+        }
+        # Operator -> handler(left, right, node) for evaluated operands;
+        # AND/OR short-circuit before reaching this table
+        self._binary_dispatch = {
+            '+': self._op_add,
+            '-': self._op_sub,
+            '*': self._op_mul,
+            '/': self._op_div,
+            '%': self._op_mod,
+            '==': lambda left, right, node: left == right,
+            '!=': lambda left, right, node: left != right,
+            '<': lambda left, right, node: left < right,
+            '>': lambda left, right, node: left > right,
+            '<=': lambda left, right, node: left <= right,
+            '>=': lambda left, right, node: left >= right,
+            '&': self._bitwise("Bitwise AND", operator.and_),
+            '|': self._bitwise("Bitwise OR", operator.or_),
+            '^': self._bitwise("Bitwise XOR", operator.xor),
+            '<<': self._bitwise("Bitwise shift", operator.lshift),
+            '>>': self._bitwise("Bitwise shift", operator.rshift),
+        }
+        # Pure expressions (no rite calls inside) never suspend and are
+        # evaluated by plain method calls instead of coroutines
+        self._eval_sync_dispatch = {
+            Identifier: self.eval_identifier,
+            BinaryOp: self._eval_binary_op_sync,
+            UnaryOp: self._eval_unary_op_sync,
+            IndexExpr: self._eval_index_sync,
+            MemberExpr: self._eval_member_sync,
+            ArrayLiteral: self._eval_array_literal_sync,
+            MapLiteral: self._eval_map_literal_sync,
+        }
+        # Statement handlers for pure statements, which exec_statements runs
+        # as plain calls; the values involved never suspend
+        self._exec_sync_dispatch = {
+            VarDecl: self._exec_var_decl_sync,
+            ConstDecl: self._exec_const_decl_sync,
+            Assignment: self._exec_assignment_sync,
+            RiteDef: self._exec_rite_def_sync,
+            ExprStmt: self._exec_expr_stmt_sync,
+        }
 
     async def run(self, program: Program):
         """Execute a program."""
         # Create THIS entity
         self.this_entity = ThisEntity()
         self.entities['THIS'] = self.this_entity
+        self._fixed_names['THIS'] = self.this_entity
+
+        # Fold literal-only operations once up front, into a copy: the
+        # caller's program may be cached and later run under a debugger,
+        # which must display the statements exactly as written
+        if not self.debugger:
+            program = fold_constants(program, self._binary_op, self._unary_op)
 
         try:
             # Execute all statements
-            for stmt in program.statements:
-                await self.execute(stmt)
+            await self.exec_statements(program.statements)
 
             # Check if program ended without THIS.DIE()
             if self.this_entity and self.this_entity.is_alive:
@@ -120,51 +211,62 @@ class Interpreter:
             for entity in list(self.entities.values()):
                 if entity.is_alive:
                     entity.die()
-            # Wait for all pending tasks to finish
+            # Wait for the tasks still running; finished ones have already
+            # removed themselves
             if self._pending_tasks:
                 await asyncio.gather(*self._pending_tasks, return_exceptions=True)
-
-    async def execute(self, node):
-        """Execute a statement or expression."""
-        if self.debugger:
-            # Need to import locally to check state enum if not imported at top
-            from .debugger import DebuggerState
-            if self.debugger.state == DebuggerState.STEPPING:
-                branch_context = current_branch_var.get()
-                should_continue = await self.debugger.step_hook(
-                    node, self.current_scope, branch_context, self
-                )
-                if not should_continue:
-                    raise DebuggerQuitException()
-
-        if isinstance(node, ImportStmt):
-            return await self.exec_import(node)
-        if isinstance(node, BifurcateStmt):
-            return await self.exec_bifurcate(node)
-        if isinstance(node, AthLoop):
-            return await self.exec_ath_loop(node)
-        if isinstance(node, DieStmt):
-            return await self.exec_die(node)
-        if isinstance(node, VarDecl):
-            return await self.exec_var_decl(node)
-        if isinstance(node, ConstDecl):
-            return await self.exec_const_decl(node)
-        if isinstance(node, Assignment):
-            return await self.exec_assignment(node)
-        if isinstance(node, RiteDef):
-            return await self.exec_rite_def(node)
-        if isinstance(node, Conditional):
-            return await self.exec_conditional(node)
-        if isinstance(node, AttemptSalvage):
-            return await self.exec_attempt_salvage(node)
-        if isinstance(node, CondemnStmt):
-            return await self.exec_condemn(node)
-        if isinstance(node, BequeathStmt):
-            return await self.exec_bequeath(node)
-        if isinstance(node, ExprStmt):
-            return await self.evaluate(node.expression)
-
-        raise RuntimeError(f"Unknown statement type: {type(node).__name__}")
+                # All finished; don't carry them into a later run()
+                self._pending_tasks.clear()
+
+    @property
+    def debugger(self) -> 'Optional[Debugger]':
+        return self._debugger
+
+    @debugger.setter
+    def debugger(self, debugger: 'Optional[Debugger]'):
+        self._debugger = debugger
+        # execute() is rebound whenever the debugger changes, so programs
+        # run without one never test for it on a statement
+        self.execute = self._execute_with_debugger if debugger else self._execute_fast
+
+    async def _execute_with_debugger(self, node):
+        """Execute a statement, first giving the debugger a chance to pause."""
+        # Need to import locally to check state enum if not imported at top
+        from .debugger import DebuggerState
+        if self._debugger.state == DebuggerState.STEPPING:
+            branch_context = current_branch_var.get()
+            should_continue = await self._debugger.step_hook(
+                node, self.current_scope, branch_context, self
+            )
+            if not should_continue:
+                raise DebuggerQuitException()
+        return await self._execute_fast(node)
+
+    async def _execute_fast(self, node):
+        """Execute a statement."""
+        handler = self._exec_dispatch.get(type(node))
+        if handler is None:
+            raise RuntimeError(f"Unknown statement type: {type(node).__name__}")
+        return await handler(node)
+
+    def _track_task(self, task: asyncio.Task):
+        """Keep a background task until it finishes, so run() can await it."""
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Task):
+        self._pending_tasks.discard(task)
+        # Retrieve the outcome, as gathering with return_exceptions did, so
+        # a failed task is not reported as never retrieved
+        if not task.cancelled():
+            task.exception()
+
+    async def exec_expr_stmt(self, node: ExprStmt):
+        """Execute an expression statement."""
+        return await self.evaluate(node.expression)
+
+    def _exec_expr_stmt_sync(self, node: ExprStmt):
+        return self._eval_sync(node.expression)
 
     async def exec_import(self, node: ImportStmt):
         """Execute an import statement."""
@@ -232,22 +334,11 @@ class Interpreter:
         # Start the entity's lifecycle
         task = asyncio.create_task(entity.start())
         entity._task = task
-        self._pending_tasks.append(task)
+        self._track_task(task)
 
     def _duration_to_ms(self, duration: Duration) -> int:
         """Convert a duration to milliseconds."""
-        value = duration.value
-        unit = duration.unit
-        if unit == 'ms':
-            ms = value
-        elif unit == 's':
-            ms = value * 1000
-        elif unit == 'm':
-            ms = value * 60 * 1000
-        elif unit == 'h':
-            ms = value * 60 * 60 * 1000
-        else:
-            ms = value  # Default to ms
+        ms = duration.ms
 
         # Enforce minimum duration of 1ms
         if ms < 1:
@@ -257,18 +348,19 @@ class Interpreter:
 
     def _resolve_import_path(self, filepath: str) -> str:
         """Resolve a filepath relative to the current source file's directory."""
-        if os.path.isabs(filepath):
-            return os.path.normpath(filepath)
-        base_dir = os.path.dirname(self.source_file) if self.source_file else os.getcwd()
-        return os.path.normpath(os.path.join(base_dir, filepath))
+        resolved = self._path_cache.get(filepath)
+        if resolved is None:
+            if os.path.isabs(filepath):
+                resolved = os.path.normpath(filepath)
+            else:
+                resolved = os.path.normpath(os.path.join(self._base_dir, filepath))
+            self._path_cache[filepath] = resolved
+        return resolved
 
     async def _load_module(self, entity, resolved_path: str, node):
         """Load a .~ATH file as a module, populating entity.exports."""
-        from .lexer import Lexer
-        from .parser import Parser
-
         # Circular import detection
-        if resolved_path in self._import_stack:
+        if resolved_path in self._import_paths:
             chain = " -> ".join(self._import_stack + [resolved_path])
             raise RuntimeError(f"Circular import detected: {chain}", node.line, node.column)
 
@@ -281,18 +373,17 @@ class Interpreter:
         except IOError as e:
             raise RuntimeError(f"Cannot read module file: {e}", node.line, node.column)
 
-        # Lex & parse
+        # Lex & parse (cached by source text, so re-imports of an unchanged
+        # file skip straight to running it)
         try:
-            lexer = Lexer(source)
-            tokens = lexer.tokenize()
-            parser = Parser(tokens)
-            program = parser.parse()
+            program = _parse_module(source)
         except Exception as e:
             raise RuntimeError(f"Error in module '{resolved_path}': {e}", node.line, node.column)
 
         # Create child interpreter
         child = Interpreter(source_file=resolved_path)
         child._import_stack = self._import_stack + [resolved_path]
+        child._import_paths = self._import_paths | {resolved_path}
 
         # Run module
         await child.run(program)
@@ -352,8 +443,7 @@ class Interpreter:
             token = current_branch_var.set(branch_name)
             try:
                 # Execute body
-                for stmt in node.body:
-                    await self.execute(stmt)
+                await self.exec_statements(node.body)
 
                 # Execute EXECUTE clause
                 await self.exec_statements(node.execute)
@@ -368,7 +458,7 @@ class Interpreter:
 
         # Schedule branch to run
         task = asyncio.create_task(run_branch())
-        self._pending_tasks.append(task)
+        self._track_task(task)
 
         # Give other branches a chance to start
         await asyncio.sleep(0)
@@ -376,17 +466,17 @@ class Interpreter:
     async def resolve_entity_expr(self, expr) -> Entity:
         """Resolve an entity expression to an Entity object."""
         if isinstance(expr, EntityIdent):
-            name = expr.name
-            if name not in self.entities:
-                raise RuntimeError(f"Unknown entity: {name}", expr.line, expr.column)
-            return self.entities[name]
+            try:
+                return self.entities[expr.name]
+            except KeyError:
+                raise RuntimeError(f"Unknown entity: {expr.name}", expr.line, expr.column) from None
 
         if isinstance(expr, EntityAnd):
             left = await self.resolve_entity_expr(expr.left)
             right = await self.resolve_entity_expr(expr.right)
             composite = CompositeEntity(f"({left.name} && {right.name})", 'AND', [left, right])
             task = asyncio.create_task(composite.start())
-            self._pending_tasks.append(task)
+            self._track_task(task)
             return composite
 
         if isinstance(expr, EntityOr):
@@ -394,14 +484,14 @@ class Interpreter:
             right = await self.resolve_entity_expr(expr.right)
             composite = CompositeEntity(f"({left.name} || {right.name})", 'OR', [left, right])
             task = asyncio.create_task(composite.start())
-            self._pending_tasks.append(task)
+            self._track_task(task)
             return composite
 
         if isinstance(expr, EntityNot):
             inner = await self.resolve_entity_expr(expr.operand)
             composite = CompositeEntity(f"(!{inner.name})", 'NOT', [inner])
             task = asyncio.create_task(composite.start())
-            self._pending_tasks.append(task)
+            self._track_task(task)
             return composite
 
         raise RuntimeError(f"Unknown entity expression type", expr.line, expr.column)
@@ -426,42 +516,75 @@ class Interpreter:
         value = await self.evaluate(node.value)
         self.current_scope.define(node.name, value, constant=False)
 
+    def _exec_var_decl_sync(self, node: VarDecl):
+        self.current_scope.define(node.name, self._eval_sync(node.value), constant=False)
+
     async def exec_const_decl(self, node: ConstDecl):
         """Execute a constant declaration."""
         value = await self.evaluate(node.value)
         self.current_scope.define(node.name, value, constant=True)
 
+    def _exec_const_decl_sync(self, node: ConstDecl):
+        self.current_scope.define(node.name, self._eval_sync(node.value), constant=True)
+
     async def exec_assignment(self, node: Assignment):
         """Execute an assignment."""
         value = await self.evaluate(node.value)
         target = node.target
+        target_type = type(target)
 
-        if isinstance(target, Identifier):
+        if target_type is Identifier:
             self.current_scope.set(target.name, value)
-        elif isinstance(target, IndexExpr):
+        elif target_type is IndexExpr:
             obj = await self.evaluate(target.obj)
             index = await self.evaluate(target.index)
-            if isinstance(obj, list):
-                if not isinstance(index, int):
-                    raise RuntimeError("Array index must be an integer", node.line, node.column)
-                if index < 0 or index >= len(obj):
-                    raise RuntimeError(f"Array index out of bounds: {index}", node.line, node.column)
-                obj[index] = value
-            elif isinstance(obj, dict):
-                obj[str(index)] = value
-            else:
-                raise RuntimeError("Cannot index non-collection", node.line, node.column)
-        elif isinstance(target, MemberExpr):
+            self._assign_index(obj, index, value, node)
+        elif target_type is MemberExpr:
             obj = await self.evaluate(target.obj)
-            if isinstance(obj, dict):
-                obj[target.member] = value
-            else:
-                raise RuntimeError("Cannot access member of non-map", node.line, node.column)
+            self._assign_member(obj, target.member, value, node)
+        else:
+            raise RuntimeError("Invalid assignment target", node.line, node.column)
+
+    def _exec_assignment_sync(self, node: Assignment):
+        value = self._eval_sync(node.value)
+        target = node.target
+        target_type = type(target)
+
+        if target_type is Identifier:
+            self.current_scope.set(target.name, value)
+        elif target_type is IndexExpr:
+            obj = self._eval_sync(target.obj)
+            index = self._eval_sync(target.index)
+            self._assign_index(obj, index, value, node)
+        elif target_type is MemberExpr:
+            self._assign_member(self._eval_sync(target.obj), target.member, value, node)
         else:
             raise RuntimeError("Invalid assignment target", node.line, node.column)
 
+    def _assign_index(self, obj: Any, index: Any, value: Any, node):
+        # Program values are exact built-in types, never subclasses
+        if type(obj) is list:
+            if not isinstance(index, int):
+                raise RuntimeError("Array index must be an integer", node.line, node.column)
+            if index < 0 or index >= len(obj):
+                raise RuntimeError(f"Array index out of bounds: {index}", node.line, node.column)
+            obj[index] = value
+        elif type(obj) is dict:
+            obj[str(index)] = value
+        else:
+            raise RuntimeError("Cannot index non-collection", node.line, node.column)
+
+    def _assign_member(self, obj: Any, member: str, value: Any, node):
+        if type(obj) is dict:
+            obj[member] = value
+        else:
+            raise RuntimeError("Cannot access member of non-map", node.line, node.column)
+
     async def exec_rite_def(self, node: RiteDef):
         """Execute a rite definition."""
+        self._exec_rite_def_sync(node)
+
+    def _exec_rite_def_sync(self, node: RiteDef):
         rite = UserRite(node.name, node.params, node.body, self.current_scope)
         self.current_scope.define(node.name, rite, constant=True)
 
@@ -502,60 +625,78 @@ class Interpreter:
 
     async def exec_statements(self, statements: List):
         """Execute a list of statements."""
+        # Pure statements run as plain calls, except under a debugger, which
+        # must get the chance to pause on every statement in execute()
+        sync_dispatch = self._exec_sync_dispatch if self._debugger is None else {}
         for stmt in statements:
-            await self.execute(stmt)
+            handler = sync_dispatch.get(type(stmt))
+            if handler is not None and stmt.pure:
+                handler(stmt)
+            else:
+                await self.execute(stmt)
 
     # ============ Expression Evaluation ============
 
     async def evaluate(self, node) -> Any:
         """Evaluate an expression."""
-        if isinstance(node, Literal):
+        if type(node) is Literal:
             return node.value
+        if node.pure:
+            return self._eval_sync(node)
 
-        if isinstance(node, Identifier):
-            name = node.name
-            # Check for THIS
-            if name == 'THIS':
-                return self.this_entity
-            # Check for built-in rite
-            builtin = self.builtins.get(name)
-            if builtin:
-                return builtin
-            # Check scope
-            if self.current_scope.has(name):
-                return self.current_scope.get(name)
-            # Check for module watcher entities
-            if name in self.entities:
-                entity = self.entities[name]
-                if isinstance(entity, WatcherEntity) and entity.is_module:
-                    return entity
-            raise RuntimeError(f"Undefined variable: {name}")
-
-        if isinstance(node, BinaryOp):
-            return await self.eval_binary_op(node)
+        handler = self._eval_dispatch.get(type(node))
+        if handler is None:
+            raise RuntimeError(f"Unknown expression type: {type(node).__name__}")
+        return await handler(node)
 
-        if isinstance(node, UnaryOp):
-            return await self.eval_unary_op(node)
+    def _eval_sync(self, node) -> Any:
+        """Evaluate a pure expression without awaiting."""
+        if type(node) is Literal:
+            return node.value
+        return self._eval_sync_dispatch[type(node)](node)
 
-        if isinstance(node, CallExpr):
-            return await self.eval_call(node)
+    def eval_identifier(self, node: Identifier) -> Any:
+        """Evaluate a name: THIS, a builtin, a variable or a module."""
+        name = node.name
+        # Check for THIS or a built-in rite
+        fixed = self._fixed_names.get(name)
+        if fixed is not None:
+            return fixed
+        # Check scope
+        scope = self.current_scope.resolve(name)
+        if scope is not None:
+            return scope.variables[name]
+        # Check for module watcher entities
+        if name in self.entities:
+            entity = self.entities[name]
+            if isinstance(entity, WatcherEntity) and entity.is_module:
+                return entity
+        raise RuntimeError(f"Undefined variable: {name}")
 
-        if isinstance(node, IndexExpr):
-            return await self.eval_index(node)
+    async def eval_array_literal(self, node: ArrayLiteral) -> list:
+        """Evaluate an array literal."""
+        return await self._eval_each(node.elements)
 
-        if isinstance(node, MemberExpr):
-            return await self.eval_member(node)
+    async def eval_map_literal(self, node: MapLiteral) -> dict:
+        """Evaluate a map literal."""
+        result = {}
+        for key, value in node.entries:
+            result[key] = self._eval_sync(value) if value.pure else await self.evaluate(value)
+        return result
 
-        if isinstance(node, ArrayLiteral):
-            return [await self.evaluate(e) for e in node.elements]
+    async def _eval_each(self, nodes: List) -> list:
+        """Evaluate expressions in order, calling the pure ones directly."""
+        # Only an impure sibling (one containing a call) costs a coroutine
+        eval_sync = self._eval_sync
+        return [eval_sync(e) if e.pure else await self.evaluate(e) for e in nodes]
 
-        if isinstance(node, MapLiteral):
-            result = {}
-            for key, value in node.entries:
-                result[key] = await self.evaluate(value)
-            return result
+    def _eval_array_literal_sync(self, node: ArrayLiteral) -> list:
+        eval_sync = self._eval_sync
+        return [eval_sync(e) for e in node.elements]
 
-        raise RuntimeError(f"Unknown expression type: {type(node).__name__}")
+    def _eval_map_literal_sync(self, node: MapLiteral) -> dict:
+        eval_sync = self._eval_sync
+        return {key: eval_sync(value) for key, value in node.entries}
 
     async def eval_binary_op(self, node: BinaryOp) -> Any:
         """Evaluate a binary operation."""
@@ -577,95 +718,91 @@ class Interpreter:
         # Evaluate both operands
         left = await self.evaluate(node.left)
         right = await self.evaluate(node.right)
+        return self._binary_op(op, left, right, node)
 
-        if op == '+':
-            if isinstance(left, str) or isinstance(right, str):
-                return stringify(left) + stringify(right)
-            if isinstance(left, (int, float)) and isinstance(right, (int, float)):
-                return left + right
-            raise RuntimeError(f"Cannot add {stringify(left)} and {stringify(right)}",
-                               node.line, node.column)
-
-        if op == '-':
-            if isinstance(left, (int, float)) and isinstance(right, (int, float)):
-                return left - right
-            raise RuntimeError(f"Cannot subtract {stringify(right)} from {stringify(left)}",
-                               node.line, node.column)
-
-        if op == '*':
-            if isinstance(left, (int, float)) and isinstance(right, (int, float)):
-                return left * right
-            raise RuntimeError(f"Cannot multiply {stringify(left)} by {stringify(right)}",
-                               node.line, node.column)
-
-        if op == '/':
-            if isinstance(left, (int, float)) and isinstance(right, (int, float)):
-                if right == 0:
-                    raise RuntimeError("Division by zero", node.line, node.column)
-                if isinstance(left, int) and isinstance(right, int):
-                    return left // right  # Integer division
-                return left / right
-            raise RuntimeError(f"Cannot divide {stringify(left)} by {stringify(right)}",
-                               node.line, node.column)
-
-        if op == '%':
-            if isinstance(left, int) and isinstance(right, int):
-                if right == 0:
-                    raise RuntimeError("Modulo by zero", node.line, node.column)
-                return left % right
-            raise RuntimeError(f"Cannot modulo {stringify(left)} by {stringify(right)}",
-                               node.line, node.column)
-
-        if op == '==':
-            return left == right
-
-        if op == '!=':
-            return left != right
-
-        if op == '<':
-            return left < right
-
-        if op == '>':
-            return left > right
-
-        if op == '<=':
-            return left <= right
-
-        if op == '>=':
-            return left >= right
-
-        # Bitwise operators
-        if op == '&':
-            if isinstance(left, int) and isinstance(right, int):
-                return left & right
-            raise RuntimeError(f"Bitwise AND expects integers", node.line, node.column)
-
-        if op == '|':
-            if isinstance(left, int) and isinstance(right, int):
-                return left | right
-            raise RuntimeError(f"Bitwise OR expects integers", node.line, node.column)
-
-        if op == '^':
-            if isinstance(left, int) and isinstance(right, int):
-                return left ^ right
-            raise RuntimeError(f"Bitwise XOR expects integers", node.line, node.column)
+    def _eval_binary_op_sync(self, node: BinaryOp) -> Any:
+        op = node.operator
+        left = self._eval_sync(node.left)
 
-        if op == '<<':
+        # Short-circuit operators
+        if op == 'AND':
+            return self._eval_sync(node.right) if is_truthy(left) else left
+        if op == 'OR':
+            return left if is_truthy(left) else self._eval_sync(node.right)
+
+        return self._binary_op(op, left, self._eval_sync(node.right), node)
+
+    def _binary_op(self, op: str, left: Any, right: Any, node: BinaryOp) -> Any:
+        """Apply a non-short-circuit binary operator to evaluated operands."""
+        handler = self._binary_dispatch.get(op)
+        if handler is None:
+            raise RuntimeError(f"Unknown operator: {op}", node.line, node.column)
+        return handler(left, right, node)
+
+    # Arithmetic handlers try the exact int/float case first; bools and
+    # mixed operands fall through to the general isinstance checks
+
+    def _op_add(self, left: Any, right: Any, node: BinaryOp) -> Any:
+        if type(left) is int and type(right) is int:
+            return left + right
+        if isinstance(left, str) or isinstance(right, str):
+            return stringify(left) + stringify(right)
+        if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+            return left + right
+        raise RuntimeError(f"Cannot add {stringify(left)} and {stringify(right)}",
+                           node.line, node.column)
+
+    def _op_sub(self, left: Any, right: Any, node: BinaryOp) -> Any:
+        if type(left) is int and type(right) is int:
+            return left - right
+        if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+            return left - right
+        raise RuntimeError(f"Cannot subtract {stringify(right)} from {stringify(left)}",
+                           node.line, node.column)
+
+    def _op_mul(self, left: Any, right: Any, node: BinaryOp) -> Any:
+        if type(left) is int and type(right) is int:
+            return left * right
+        if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+            return left * right
+        raise RuntimeError(f"Cannot multiply {stringify(left)} by {stringify(right)}",
+                           node.line, node.column)
+
+    def _op_div(self, left: Any, right: Any, node: BinaryOp) -> Any:
+        if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+            if right == 0:
+                raise RuntimeError("Division by zero", node.line, node.column)
             if isinstance(left, int) and isinstance(right, int):
-                return left << right
-            raise RuntimeError(f"Bitwise shift expects integers", node.line, node.column)
-
-        if op == '>>':
+                return left // right  # Integer division
+            return left / right
+        raise RuntimeError(f"Cannot divide {stringify(left)} by {stringify(right)}",
+                           node.line, node.column)
+
+    def _op_mod(self, left: Any, right: Any, node: BinaryOp) -> Any:
+        if isinstance(left, int) and isinstance(right, int):
+            if right == 0:
+                raise RuntimeError("Modulo by zero", node.line, node.column)
+            return left % right
+        raise RuntimeError(f"Cannot modulo {stringify(left)} by {stringify(right)}",
+                           node.line, node.column)
+
+    def _bitwise(self, name: str, apply):
+        """Build a handler for an integer-only bitwise operator."""
+        def handler(left: Any, right: Any, node: BinaryOp) -> Any:
             if isinstance(left, int) and isinstance(right, int):
-                return left >> right
-            raise RuntimeError(f"Bitwise shift expects integers", node.line, node.column)
-
-        raise RuntimeError(f"Unknown operator: {op}", node.line, node.column)
+                return apply(left, right)
+            raise RuntimeError(f"{name} expects integers", node.line, node.column)
+        return handler
 
     async def eval_unary_op(self, node: UnaryOp) -> Any:
         """Evaluate a unary operation."""
-        operand = await self.evaluate(node.operand)
+        return self._unary_op(await self.evaluate(node.operand), node)
+
+    def _eval_unary_op_sync(self, node: UnaryOp) -> Any:
+        return self._unary_op(self._eval_sync(node.operand), node)
 
+    def _unary_op(self, operand: Any, node: UnaryOp) -> Any:
+        """Apply a unary operator to an evaluated operand."""
         if node.operator == 'NOT':
             return not is_truthy(operand)
 
@@ -684,7 +821,7 @@ class Interpreter:
     async def eval_call(self, node: CallExpr) -> Any:
         """Evaluate a function call."""
         callee = await self.evaluate(node.callee)
-        args = [await self.evaluate(arg) for arg in node.args]
+        args = await self._eval_each(node.args)
 
         # Built-in function
         if callable(callee) and not isinstance(callee, UserRite):
@@ -718,9 +855,15 @@ class Interpreter:
             self.current_scope.define(param, arg)
 
         try:
-            # Execute body
+            # Execute body; the exec_statements loop is inlined, since this
+            # is the hottest statement loop
+            sync_dispatch = self._exec_sync_dispatch if self._debugger is None else {}
             for stmt in rite.body:
-                await self.execute(stmt)
+                handler = sync_dispatch.get(type(stmt))
+                if handler is not None and stmt.pure:
+                    handler(stmt)
+                else:
+                    await self.execute(stmt)
             return None  # No BEQUEATH reached
         except BequeathError as e:
             return e.value
@@ -731,21 +874,31 @@ class Interpreter:
         """Evaluate an index expression."""
         obj = await self.evaluate(node.obj)
         index = await self.evaluate(node.index)
+        return self._index(obj, index, node)
+
+    def _eval_index_sync(self, node: IndexExpr) -> Any:
+        obj = self._eval_sync(node.obj)
+        return self._index(obj, self._eval_sync(node.index), node)
 
-        if isinstance(obj, list):
+    def _index(self, obj: Any, index: Any, node: IndexExpr) -> Any:
+        """Index an evaluated array, map or string."""
+        # Program values are exact built-in types, never subclasses
+        kind = type(obj)
+        if kind is list:
             if not isinstance(index, int):
                 raise RuntimeError("Array index must be an integer", node.line, node.column)
             if index < 0 or index >= len(obj):
                 raise RuntimeError(f"Array index out of bounds: {index}", node.line, node.column)
             return obj[index]
 
-        if isinstance(obj, dict):
+        if kind is dict:
             key = str(index)
-            if key not in obj:
-                raise RuntimeError(f"Key not found in map: {key}", node.line, node.column)
-            return obj[key]
+            try:
+                return obj[key]
+            except KeyError:
+                raise RuntimeError(f"Key not found in map: {key}", node.line, node.column) from None
 
-        if isinstance(obj, str):
+        if kind is str:
             if not isinstance(index, int):
                 raise RuntimeError("String index must be an integer", node.line, node.column)
             if index < 0 or index >= len(obj):
@@ -756,16 +909,24 @@ class Interpreter:
 
     async def eval_member(self, node: MemberExpr) -> Any:
         """Evaluate a member expression."""
-        obj = await self.evaluate(node.obj)
+        return self._member(await self.evaluate(node.obj), node)
 
-        if isinstance(obj, dict):
-            if node.member not in obj:
-                raise RuntimeError(f"Key not found in map: {node.member}", node.line, node.column)
-            return obj[node.member]
+    def _eval_member_sync(self, node: MemberExpr) -> Any:
+        return self._member(self._eval_sync(node.obj), node)
+
+    def _member(self, obj: Any, node: MemberExpr) -> Any:
+        """Read a member of an evaluated map or module."""
+        # One hash probe on success; the miss is the rare, raising path
+        if type(obj) is dict:
+            try:
+                return obj[node.member]
+            except KeyError:
+                raise RuntimeError(f"Key not found in map: {node.member}", node.line, node.column) from None
 
         if isinstance(obj, WatcherEntity) and obj.is_module:
-            if node.member not in obj.exports:
-                raise RuntimeError(f"Module '{obj.name}' has no export '{node.member}'", node.line, node.column)
-            return obj.exports[node.member]
+            try:
+                return obj.exports[node.member]
+            except KeyError:
+                raise RuntimeError(f"Module '{obj.name}' has no export '{node.member}'", node.line, node.column) from None
 
         raise RuntimeError(f"Cannot access member of {stringify(obj)}", node.line, node.column)
@@ -1,6 +1,7 @@
 """Lexer for the !~ATH language."""
 
 import re
+import sys
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import List, Optional
@@ -9,6 +10,10 @@ from .errors import LexerError
 
 
 class TokenType(Enum):
+    # Members are singletons, so identity hashing is equivalent to Enum's
+    # name-based __hash__ and keeps set/dict lookups on token types in C.
+    __hash__ = object.__hash__
+
     # Literals
     INTEGER = auto()
     FLOAT = auto()
@@ -95,7 +100,7 @@ class TokenType(Enum):
     EOF = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     type: TokenType
     value: any
@@ -134,6 +139,96 @@ KEYWORDS = {
     'NOT': TokenType.NOT,
 }
 
+# Runs scanned in one regex match rather than a Python loop per character.
+# \w is exactly str.isalnum() plus '_', the identifier continuation class.
+IDENTIFIER_RE = re.compile(r'\w*')
+STRING_CHUNK_RE = re.compile(r'[^"\\]*')
+
+# String escape sequences: character after the backslash -> replacement
+ESCAPES = {
+    'n': '\n',
+    't': '\t',
+    '\\': '\\',
+    '"': '"',
+}
+
+# Operators are matched longest-first: two-character tokens before single ones
+TWO_CHAR_TOKENS = {
+    '&&': TokenType.AMPAMP,
+    '||': TokenType.PIPEPIPE,
+    '<<': TokenType.LSHIFT,
+    '>>': TokenType.RSHIFT,
+    '==': TokenType.EQ,
+    '!=': TokenType.NE,
+    '<=': TokenType.LE,
+    '>=': TokenType.GE,
+}
+
+SINGLE_CHAR_TOKENS = {
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.STAR,
+    '/': TokenType.SLASH,
+    '%': TokenType.PERCENT,
+    '<': TokenType.LT,
+    '>': TokenType.GT,
+    '=': TokenType.ASSIGN,
+    '!': TokenType.BANG,
+    '&': TokenType.AMP,
+    '|': TokenType.PIPE,
+    '^': TokenType.CARET,
+    '~': TokenType.TILDE,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET,
+    ']': TokenType.RBRACKET,
+    ';': TokenType.SEMICOLON,
+    ',': TokenType.COMMA,
+    '.': TokenType.DOT,
+    ':': TokenType.COLON,
+}
+
+# Tokens that end a value: a '-' directly after one of these is subtraction,
+# otherwise a '-' immediately followed by a digit starts a negative number.
+VALUE_END_TOKENS = frozenset({
+    TokenType.IDENTIFIER,
+    TokenType.INTEGER, TokenType.FLOAT, TokenType.STRING, TokenType.DURATION,
+    TokenType.ALIVE, TokenType.DEAD, TokenType.VOID,
+    TokenType.RPAREN, TokenType.RBRACKET,
+})
+
+# Duration suffixes accepted directly after an integer, longest first
+DURATION_UNITS = ('ms', 's', 'm', 'h')
+
+# A number: float, or integer with an optional duration suffix. \d matches
+# the Unicode decimal digits (str.isdecimal), all of which int() and float()
+# accept; characters such as '²' that are digits but not decimal are not
+# numbers.
+NUMBER_PATTERN = r'\d+(?:\.\d+|%s)?' % '|'.join(DURATION_UNITS)
+NUMBER_RE = re.compile(NUMBER_PATTERN)
+
+# Master pattern: one match per token (or per run of whitespace and comments).
+# Strings and non-ASCII identifiers are left to the dedicated readers.
+TOKEN_RE = re.compile('|'.join([
+    r'(?P<skip>(?:[ \t\r\n]+|//[^\n]*)+)',
+    r'(?P<ath>~ATH)',
+    r'(?P<string>")',
+    rf'(?P<number>{NUMBER_PATTERN})',
+    r'(?P<identifier>[A-Za-z_]\w*)',
+    '(?P<operator>' + '|'.join(
+        re.escape(op) for op in (*TWO_CHAR_TOKENS, *SINGLE_CHAR_TOKENS)
+    ) + ')',
+]))
+
+# Keywords whose token value is a literal rather than the keyword text
+KEYWORD_VALUES = {
+    'ALIVE': True,
+    'DEAD': False,
+    'VOID': None,
+}
+
 
 class Lexer:
     def __init__(self, source: str):
@@ -164,245 +259,133 @@ class Lexer:
             self.column += 1
         return ch
 
-    def skip_whitespace_and_comments(self):
-        while self.pos < len(self.source):
-            ch = self.peek()
-            if ch in ' \t\r\n':
-                self.advance()
-            elif ch == '/' and self.peek(1) == '/':
-                # Single-line comment
-                while self.peek() is not None and self.peek() != '\n':
-                    self.advance()
-            else:
-                break
+    def _advance_to(self, end: int):
+        """Move to end, updating line and column for any newlines passed."""
+        newlines = self.source.count('\n', self.pos, end)
+        if newlines:
+            self.line += newlines
+            self.column = end - self.source.rfind('\n', self.pos, end)
+        else:
+            self.column += end - self.pos
+        self.pos = end
 
     def read_string(self) -> str:
-        start_line, start_col = self.line, self.column
         self.advance()  # consume opening quote
         result = []
 
         while True:
+            # Copy everything up to the next quote or backslash in one slice
+            end = STRING_CHUNK_RE.match(self.source, self.pos).end()
+            if end > self.pos:
+                result.append(self.source[self.pos:end])
+                self._advance_to(end)
+
             ch = self.peek()
             if ch is None:
                 raise self.error("Unterminated string")
             if ch == '"':
                 self.advance()
                 break
-            if ch == '\\':
-                self.advance()
-                escape = self.peek()
-                if escape is None:
-                    raise self.error("Unterminated string")
-                if escape == 'n':
-                    result.append('\n')
-                elif escape == 't':
-                    result.append('\t')
-                elif escape == '\\':
-                    result.append('\\')
-                elif escape == '"':
-                    result.append('"')
-                else:
-                    raise self.error(f"Unknown escape sequence: \\{escape}")
-                self.advance()
-            else:
-                result.append(ch)
-                self.advance()
-
-        return ''.join(result)
-
-    def read_number(self) -> Token:
-        start_line, start_col = self.line, self.column
-        result = []
-
-        # Handle negative sign
-        if self.peek() == '-':
-            result.append(self.advance())
 
-        # Read digits
-        while self.peek() is not None and self.peek().isdigit():
-            result.append(self.advance())
+            self.advance()  # consume backslash
+            escape = self.peek()
+            if escape is None:
+                raise self.error("Unterminated string")
+            if escape not in ESCAPES:
+                raise self.error(f"Unknown escape sequence: \\{escape}")
+            result.append(ESCAPES[escape])
+            self.advance()
 
-        # Check for float
-        if self.peek() == '.' and self.peek(1) is not None and self.peek(1).isdigit():
-            result.append(self.advance())  # consume '.'
-            while self.peek() is not None and self.peek().isdigit():
-                result.append(self.advance())
-            return Token(TokenType.FLOAT, float(''.join(result)), start_line, start_col)
+        return ''.join(result)
 
-        value = int(''.join(result))
+    def number_token(self, text: str, line: int, column: int) -> Token:
+        """Build the token for a NUMBER_PATTERN match (optionally with a leading '-')."""
+        if '.' in text:
+            return Token(TokenType.FLOAT, float(text), line, column)
 
-        # Check for duration suffix
-        if self.peek() in ('m', 's', 'h'):
-            suffix_start = self.pos
-            suffix = self.advance()
-            if suffix == 'm' and self.peek() == 's':
-                self.advance()
-                return Token(TokenType.DURATION, ('ms', value), start_line, start_col)
-            elif suffix == 's':
-                return Token(TokenType.DURATION, ('s', value), start_line, start_col)
-            elif suffix == 'm':
-                return Token(TokenType.DURATION, ('m', value), start_line, start_col)
-            elif suffix == 'h':
-                return Token(TokenType.DURATION, ('h', value), start_line, start_col)
+        # Anything after the sign and digits is a duration suffix
+        digits = text.rstrip('hms')
+        if len(digits) < len(text):
+            return Token(TokenType.DURATION, (text[len(digits):], int(digits)), line, column)
 
-        return Token(TokenType.INTEGER, value, start_line, start_col)
+        return Token(TokenType.INTEGER, int(text), line, column)
 
     def read_identifier(self) -> Token:
         start_line, start_col = self.line, self.column
-        result = []
-
-        while self.peek() is not None and (self.peek().isalnum() or self.peek() == '_'):
-            result.append(self.advance())
+        start = self.pos
+        pos = IDENTIFIER_RE.match(self.source, start).end()
 
-        name = ''.join(result)
+        name = self.source[start:pos]
+        self.column += pos - start
+        self.pos = pos
         token_type = KEYWORDS.get(name, TokenType.IDENTIFIER)
+        if token_type is TokenType.IDENTIFIER:
+            value = sys.intern(name)
+        else:
+            value = KEYWORD_VALUES[name] if name in KEYWORD_VALUES else name
 
-        # Special value handling
-        if token_type == TokenType.ALIVE:
-            return Token(token_type, True, start_line, start_col)
-        elif token_type == TokenType.DEAD:
-            return Token(token_type, False, start_line, start_col)
-        elif token_type == TokenType.VOID:
-            return Token(token_type, None, start_line, start_col)
-
-        return Token(token_type, name, start_line, start_col)
+        return Token(token_type, value, start_line, start_col)
 
     def tokenize(self) -> List[Token]:
-        self.tokens = []
-
-        while self.pos < len(self.source):
-            self.skip_whitespace_and_comments()
+        # List growth is amortized in C; binding append saves an attribute
+        # lookup per token, which a preallocated list plus index would not
+        tokens = self.tokens = []
+        append = tokens.append
+        source = self.source
+        n = len(source)
+        match = TOKEN_RE.match
+
+        while self.pos < n:
+            start_line, start_col = self.line, self.column
+            m = match(source, self.pos)
 
-            if self.pos >= len(self.source):
-                break
+            if m is None:
+                # Identifiers starting with a non-ASCII letter
+                ch = source[self.pos]
+                if ch.isalpha():
+                    append(self.read_identifier())
+                    continue
+                raise self.error(f"Unexpected character: {ch!r}")
 
-            start_line, start_col = self.line, self.column
-            ch = self.peek()
+            kind = m.lastgroup
+            text = m.group()
 
-            # ~ATH special token
-            if ch == '~' and self.peek(1) == 'A' and self.peek(2) == 'T' and self.peek(3) == 'H':
-                for _ in range(4):
-                    self.advance()
-                self.tokens.append(Token(TokenType.TILDE_ATH, '~ATH', start_line, start_col))
+            if kind == 'skip':
+                self._advance_to(m.end())
                 continue
 
             # String
-            if ch == '"':
+            if kind == 'string':
                 value = self.read_string()
-                self.tokens.append(Token(TokenType.STRING, value, start_line, start_col))
+                append(Token(TokenType.STRING, value, start_line, start_col))
                 continue
 
-            # Number (including negative)
-            is_negative = False
-            if ch == '-' and self.peek(1) is not None and self.peek(1).isdigit():
-                # Check if this is unary minus (part of number) or binary minus (subtraction)
-                # If preceded by an expression terminator, it's subtraction (not negative number)
-                is_subtraction = False
-                if self.tokens:
-                    last = self.tokens[-1].type
-                    if last in (
-                        TokenType.IDENTIFIER,
-                        TokenType.INTEGER, TokenType.FLOAT, TokenType.STRING, TokenType.DURATION,
-                        TokenType.ALIVE, TokenType.DEAD, TokenType.VOID,
-                        TokenType.RPAREN, TokenType.RBRACKET
-                    ):
-                        is_subtraction = True
-                
-                if not is_subtraction:
-                    is_negative = True
-
-            if ch.isdigit() or is_negative:
-                self.tokens.append(self.read_number())
-                continue
-
-            # Identifier or keyword
-            if ch.isalpha() or ch == '_':
-                self.tokens.append(self.read_identifier())
-                continue
-
-            # Two-character operators
-            if ch == '&' and self.peek(1) == '&':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.AMPAMP, '&&', start_line, start_col))
-                continue
-
-            if ch == '|' and self.peek(1) == '|':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.PIPEPIPE, '||', start_line, start_col))
-                continue
-            
-            # Shift operators
-            if ch == '<' and self.peek(1) == '<':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.LSHIFT, '<<', start_line, start_col))
-                continue
-
-            if ch == '>' and self.peek(1) == '>':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.RSHIFT, '>>', start_line, start_col))
-                continue
-
-            if ch == '=' and self.peek(1) == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.EQ, '==', start_line, start_col))
-                continue
-
-            if ch == '!' and self.peek(1) == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.NE, '!=', start_line, start_col))
-                continue
-
-            if ch == '<' and self.peek(1) == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.LE, '<=', start_line, start_col))
-                continue
-
-            if ch == '>' and self.peek(1) == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.GE, '>=', start_line, start_col))
-                continue
-
-            # Single-character tokens
-            single_char_tokens = {
-                '+': TokenType.PLUS,
-                '-': TokenType.MINUS,
-                '*': TokenType.STAR,
-                '/': TokenType.SLASH,
-                '%': TokenType.PERCENT,
-                '<': TokenType.LT,
-                '>': TokenType.GT,
-                '=': TokenType.ASSIGN,
-                '!': TokenType.BANG,
-                '&': TokenType.AMP,
-                '|': TokenType.PIPE,
-                '^': TokenType.CARET,
-                '~': TokenType.TILDE,
-                '(': TokenType.LPAREN,
-                ')': TokenType.RPAREN,
-                '{': TokenType.LBRACE,
-                '}': TokenType.RBRACE,
-                '[': TokenType.LBRACKET,
-                ']': TokenType.RBRACKET,
-                ';': TokenType.SEMICOLON,
-                ',': TokenType.COMMA,
-                '.': TokenType.DOT,
-                ':': TokenType.COLON,
-            }
-
-            if ch in single_char_tokens:
-                self.advance()
-                self.tokens.append(Token(single_char_tokens[ch], ch, start_line, start_col))
-                continue
-
-            raise self.error(f"Unexpected character: {ch!r}")
+            if kind == 'operator' and text == '-' and source[m.end():m.end() + 1].isdecimal():
+                # Unary minus directly before digits is part of the number,
+                # unless it follows an expression terminator (subtraction)
+                if not tokens or tokens[-1].type not in VALUE_END_TOKENS:
+                    kind = 'number'
+                    text = '-' + NUMBER_RE.match(source, m.end()).group()
+
+            self.pos += len(text)
+            self.column += len(text)
+
+            if kind == 'identifier':
+                token_type = KEYWORDS.get(text, TokenType.IDENTIFIER)
+                if token_type is TokenType.IDENTIFIER:
+                    # Interned so scope dict lookups hit the identity fast path
+                    value = sys.intern(text)
+                else:
+                    value = KEYWORD_VALUES[text] if text in KEYWORD_VALUES else text
+                append(Token(token_type, value, start_line, start_col))
+            elif kind == 'number':
+                append(self.number_token(text, start_line, start_col))
+            elif kind == 'ath':
+                append(Token(TokenType.TILDE_ATH, text, start_line, start_col))
+            elif len(text) == 2:
+                append(Token(TWO_CHAR_TOKENS[text], text, start_line, start_col))
+            else:
+                append(Token(SINGLE_CHAR_TOKENS[text], text, start_line, start_col))
 
-        self.tokens.append(Token(TokenType.EOF, None, self.line, self.column))
-        return self.tokens
+        append(Token(TokenType.EOF, None, self.line, self.column))
+        return tokens
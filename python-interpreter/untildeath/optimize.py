@@ -0,0 +1,70 @@
+"""Load-time AST simplification for !~ATH programs."""
+
+from dataclasses import fields, replace
+from typing import Any, Callable
+
+from .ast_nodes import BinaryOp, Literal, UnaryOp
+
+# AND and OR short-circuit and never reach the operand-level binary_op;
+# a left shift can build an arbitrarily large integer, which should only
+# happen if the program actually gets there
+UNFOLDED_OPERATORS = frozenset({'AND', 'OR', '<<'})
+
+
+def fold_constants(node: Any, binary_op: Callable, unary_op: Callable) -> Any:
+    """Return node with operations on literal operands replaced by their result.
+
+    binary_op(op, left, right, node) and unary_op(operand, node) are the
+    interpreter's own operator implementations, so folding can never
+    disagree with evaluation. An operation that raises (a !~ATH error or
+    a Python one such as comparing a string with a number) is left
+    unfolded to fail at run time, where the error belongs.
+
+    The tree passed in is never modified: parsed programs are cached and
+    shared, and a debugger must still see them as written. Nodes with a
+    folded descendant are copied; untouched subtrees are shared with the
+    original.
+    """
+    changes = {}
+    for f in fields(node):
+        if not f.init:
+            continue  # derived fields such as pure are recomputed by replace()
+        value = getattr(node, f.name)
+        if isinstance(value, list):
+            folded = [_fold_item(item, binary_op, unary_op) for item in value]
+            if any(new is not old for new, old in zip(folded, value)):
+                changes[f.name] = folded
+        else:
+            folded = _fold(value, binary_op, unary_op)
+            if folded is not value:
+                changes[f.name] = folded
+    if changes:
+        node = replace(node, **changes)
+
+    try:
+        if (type(node) is BinaryOp and node.operator not in UNFOLDED_OPERATORS
+                and type(node.left) is Literal and type(node.right) is Literal):
+            result = binary_op(node.operator, node.left.value, node.right.value, node)
+            return Literal(value=result, line=node.line, column=node.column)
+        if type(node) is UnaryOp and type(node.operand) is Literal:
+            result = unary_op(node.operand.value, node)
+            return Literal(value=result, line=node.line, column=node.column)
+    except Exception:
+        pass
+    return node
+
+
+def _fold_item(item: Any, binary_op: Callable, unary_op: Callable) -> Any:
+    if isinstance(item, tuple):
+        # MapLiteral entries are (key, expression) pairs
+        key, expr = item
+        folded = _fold(expr, binary_op, unary_op)
+        return item if folded is expr else (key, folded)
+    return _fold(item, binary_op, unary_op)
+
+
+def _fold(value: Any, binary_op: Callable, unary_op: Callable) -> Any:
+    # Only AST nodes (dataclass instances) have children worth visiting
+    if hasattr(type(value), '__dataclass_fields__'):
+        return fold_constants(value, binary_op, unary_op)
+    return value
@@ -18,6 +18,8 @@ from .errors import ParseError
 class Parser:
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
+        # Token types in a parallel list, so check() never touches Token objects
+        self.kinds = [token.type for token in tokens]
         self.pos = 0
 
     def error(self, message: str, token: Token = None) -> ParseError:
@@ -37,7 +39,9 @@ class Parser:
         return self.tokens[pos]
 
     def check(self, *types: TokenType) -> bool:
-        return self.current().type in types
+        kinds = self.kinds
+        pos = self.pos
+        return (kinds[pos] if pos < len(kinds) else kinds[-1]) in types
 
     def advance(self) -> Token:
         token = self.current()
@@ -3,6 +3,7 @@
 import asyncio
 import sys
 import time
+from pathlib import Path
 from typing import Any, Optional
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical
@@ -11,8 +12,10 @@ from textual.widgets import Header, Footer, Static, DataTable, Tree, RichLog, Te
 from textual.binding import Binding
 from rich.text import Text
 
-from .debugger import Debugger, DebuggerState, STATEMENT_TYPES
+from .debugger import Debugger, DebuggerState, STATEMENT_TYPE_SET
 from .interpreter import Interpreter, Scope
+from .lexer import Lexer
+from .parser import Parser
 from .ast_nodes import Statement
 from .errors import TildeAthError
 
@@ -30,7 +33,7 @@ class TextualDebugger(Debugger):
 
     async def step_hook(self, node: Any, scope: Scope, branch_context: str, interpreter: Interpreter) -> bool:
         """Called by the interpreter before executing a statement."""
-        if not isinstance(node, STATEMENT_TYPES):
+        if type(node) not in STATEMENT_TYPE_SET:
             return True
 
         step_info = self._create_step_info(node, branch_context)
@@ -404,9 +407,6 @@ class AthDebuggerApp(App):
 
     def _do_save_and_run(self):
         """Parse, save to disk, and re-run."""
-        from .lexer import Lexer
-        from .parser import Parser
-
         new_source = self.source_editor.text
 
         # Try to lex + parse before committing
@@ -422,7 +422,6 @@ class AthDebuggerApp(App):
         # Save to disk
         if self._has_filename():
             try:
-                from pathlib import Path
                 Path(self.filename).write_text(new_source, encoding='utf-8')
                 self.program_output.write(f"[bold green]Saved to {self.filename}[/]")
             except IOError as e: